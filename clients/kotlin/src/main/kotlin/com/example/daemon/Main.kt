@@ -54,9 +54,9 @@ fun main() = runBlocking {
         // List tasks
         println("\n=== List Tasks ===")
         val listRequest = listTasksRequest { limit = 5 }
-        val taskList = client.listTasks(listRequest)
         println("Recent tasks:")
-        taskList.tasksList.forEach { t ->
+        // Server-streaming RPC: the coroutine stub returns a Flow
+        client.listTasks(listRequest).collect { t ->
             println("  - Task ${t.id}: ${t.taskType} (${t.status})")
         }
 
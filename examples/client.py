@@ -40,13 +40,11 @@ def scenario_basic_operations():
 
     print(f"✅ Queued {len(tasks)} tasks")
 
-    # Wait and check results
-    time.sleep(4)
-
+    # Wait for completion (long-poll, no sleep)
     print("📋 Results:")
     for name, task_id in tasks:
-        task = client.get_task(task_id)
-        print(f"{name:15} | Status: {task.status:10} | Result: {task.result}")
+        task = client.await_task(task_id)
+        print(f"{name:15} | Status: {task.status:10} | Result: {task.parsed_result}")
 
     return tasks
 
@@ -156,14 +154,14 @@ def scenario_monitoring():
     print(f"Tasks Processed: {metrics.tasks_processed}")
     print(f"Tasks Failed: {metrics.tasks_failed}")
 
-    # Generate activity
+    # Generate activity (one batch round-trip instead of 3 POSTs)
     print("🚀 Generating activity...")
-    task_ids = []
-    for i in range(3):
-        task_id = client.queue_task(
-            "image_resize", {"filename": f"image_{i}.jpg", "size": "200x200"}
-        )
-        task_ids.append(task_id)
+    task_ids = client.queue_tasks(
+        [
+            ("image_resize", {"filename": f"image_{i}.jpg", "size": "200x200"})
+            for i in range(3)
+        ]
+    )
 
     # Monitor progress
     for _ in range(2):
@@ -1,33 +1,38 @@
 #!/usr/bin/env python3
-"""Simple client usage example."""
+"""Simple client usage example (async, concurrent round-trips)."""
+
+import asyncio
 
 from examples.pydantic_daemon import EmailInput
-from task_daemon import DaemonClient
-import time
-
-client = DaemonClient("http://localhost:8080", timeout=5.0)
-
-# Queue tasks
-func_input = EmailInput(
-    recipient="user@example.com", subject="Hello", body="Test message"
-)
-task_id = client.queue_task("send_email", func_input)
-print(f"Queued task: {task_id}")
-
-# Wait and check status
-time.sleep(2)
-task = client.get_task(task_id)
-print(f"Status: {task.status}")
-print(f"Result: {task.result}")
-
-task_id = client.queue_task("simple_calculator", 1, 2)
-print(f"Queued task: {task_id}")
-
-# Wait and check status
-time.sleep(2)
-task = client.get_task(task_id)
-print(f"Status: {task.status}")
-print(f"Result: {task.result}")
-# Check health
-health = client.health_check()
-print(f"Daemon: {health.status}, Queue: {health.queue_size}")
+from task_daemon import AsyncDaemonClient
+
+
+async def run_task(client: AsyncDaemonClient, task_type: str, *args):
+    """Queue a task and long-poll until it finishes."""
+    task_id = await client.queue_task(task_type, *args)
+    print(f"Queued task: {task_id}")
+    task = await client.await_task(task_id)
+    print(f"Status: {task.status}")
+    print(f"Result: {task.parsed_result}")
+    return task
+
+
+async def main():
+    async with AsyncDaemonClient("http://localhost:8080", timeout=5.0) as client:
+        func_input = EmailInput(
+            recipient="user@example.com", subject="Hello", body="Test message"
+        )
+        # Both queue/wait pairs run concurrently: wall time is the
+        # slowest task, not the sum.
+        await asyncio.gather(
+            run_task(client, "send_email", func_input),
+            run_task(client, "simple_calculator", 1, 2),
+        )
+
+        # Check health
+        health = await client.health_check()
+        print(f"Daemon: {health.status}, Queue: {health.queue_size}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
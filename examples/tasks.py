@@ -1,9 +1,12 @@
 """Centralized task handlers for all daemon examples."""
 
 from datetime import datetime
+import logging
 import time
 from pydantic import BaseModel
 
+logger = logging.getLogger(__name__)
+
 
 # Pydantic Models
 class EmailInput(BaseModel):
@@ -38,8 +41,11 @@ class NotificationInput(BaseModel):
 # Task Handlers (no decorators)
 def send_email(task_data: EmailInput) -> EmailOutput:
     """Send email with Pydantic validation."""
-    print(f"📧 Sending email to {task_data.recipient}")
-    print(f"   Subject: {task_data.subject}")
+    logger.info(
+        "📧 Sending email to %s (subject: %s)",
+        task_data.recipient,
+        task_data.subject,
+    )
     time.sleep(1)
     return EmailOutput(
         status="sent",
@@ -50,8 +56,11 @@ def send_email(task_data: EmailInput) -> EmailOutput:
 
 def process_data(task_data: DataInput) -> DataOutput:
     """Process data with structured input/output."""
-    print(f"🔄 Processing data: {task_data.operation}")
-    print(f"   Data keys: {list(task_data.data.keys())}")
+    logger.info(
+        "🔄 Processing data: %s (keys: %s)",
+        task_data.operation,
+        list(task_data.data.keys()),
+    )
     time.sleep(2)
     return DataOutput(
         status="processed",
@@ -62,22 +71,26 @@ def process_data(task_data: DataInput) -> DataOutput:
 
 def send_notification(task_data: NotificationInput):
     """Send notification (simple return)."""
-    print(f"🔔 Notification to {task_data.user_id} via {task_data.channel}")
-    print(f"   Message: {task_data.message}")
+    logger.info(
+        "🔔 Notification to %s via %s: %s",
+        task_data.user_id,
+        task_data.channel,
+        task_data.message,
+    )
     time.sleep(0.5)
     return {"delivered": True, "channel": task_data.channel}
 
 
 def backup_data(event):
     """Legacy handler (dict input/output)."""
-    print(f"💾 Backing up: {event.get('source', 'unknown')}")
+    logger.info("💾 Backing up: %s", event.get("source", "unknown"))
     time.sleep(3)
     return {"status": "backup_complete", "files": event.get("file_count", 0)}
 
 
 def image_resize(event):
     """Image processing handler."""
-    print(f"🖼️  Resizing image: {event.get('filename', 'unknown')}")
+    logger.info("🖼️  Resizing image: %s", event.get("filename", "unknown"))
     size = event.get("size", "100x100")
     time.sleep(1.5)
     return {"status": "resized", "new_size": size, "format": "jpg"}
@@ -85,20 +98,20 @@ def image_resize(event):
 
 def failing_task(event):
     """Handler that demonstrates failure."""
-    print("💥 This task will fail...")
+    logger.info("💥 This task will fail...")
     raise Exception("Simulated task failure")
 
 
 def user_signup(event):
     """User signup handler."""
-    print(f"👤 Processing signup for {event.get('email', 'unknown')}")
+    logger.info("👤 Processing signup for %s", event.get("email", "unknown"))
     time.sleep(1)
     return {"status": "signup_processed", "user_id": event.get("user_id")}
 
 
 def log_analytics(event):
     """Analytics logging handler."""
-    print(f"📊 Logging analytics: {event.get('event', 'unknown')}")
+    logger.info("📊 Logging analytics: %s", event.get("event", "unknown"))
     time.sleep(0.5)
     return {"logged": True, "event": event.get("event")}
 
@@ -6,9 +6,21 @@ import sys
 from pathlib import Path
 
 
-def main():
+def main(force: bool = False):
     proto_dir = Path("task_daemon/proto")
     proto_file = proto_dir / "task_daemon.proto"
+    pb2_file = proto_dir / "task_daemon_pb2.py"
+    pyi_file = proto_dir / "task_daemon_pb2.pyi"
+
+    # Skip the whole protoc invocation when the generated code is
+    # already newer than the .proto, so no-op builds return instantly.
+    if (
+        not force
+        and pb2_file.exists()
+        and pb2_file.stat().st_mtime >= proto_file.stat().st_mtime
+    ):
+        print(f"✓ {pb2_file} is up to date, skipping generation (--force to override)")
+        return 0
 
     print(f"Generating protobuf code from {proto_file}...")
 
@@ -18,7 +30,9 @@ def main():
         "grpc_tools.protoc",
         f"--proto_path={proto_dir}",
         f"--python_out={proto_dir}",
+        f"--pyi_out={proto_dir}",
         f"--grpc_python_out={proto_dir}",
+        "--experimental_allow_proto3_optional",
         str(proto_file),
     ]
 
@@ -26,9 +40,10 @@ def main():
 
     if result.returncode == 0:
         print("✓ Protobuf code generated successfully")
+        print(f"✓ Type stubs written to {pyi_file}")
 
     return result.returncode
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    sys.exit(main(force="--force" in sys.argv[1:]))
@@ -1,18 +1,15 @@
 """Task Daemon - A configurable task processing system with monitoring."""
 
-from .daemon import TaskDaemon
-from .daemon.builder import DaemonBuilder
-from .client import DaemonClient
-from .client.grpc_client import GRPCDaemonClient
-from .config import DaemonConfig
-from .core import task_handler, get_all_handlers, Queue, PersistentQueue, MemoryQueue
+import importlib
 
 __version__ = "0.1.0"
 __all__ = [
     "TaskDaemon",
     "DaemonBuilder",
     "DaemonClient",
+    "AsyncDaemonClient",
     "GRPCDaemonClient",
+    "AsyncGRPCDaemonClient",
     "DaemonConfig",
     "task_handler",
     "get_all_handlers",
@@ -20,3 +17,36 @@ __all__ = [
     "PersistentQueue",
     "MemoryQueue",
 ]
+
+# PEP 562 lazy exports: each symbol's module loads on first access, so a
+# client-only `from task_daemon import DaemonClient` never imports the
+# server stack (FastAPI/uvicorn), grpc stubs, or the SQLite queue.
+_LAZY = {
+    "TaskDaemon": ".daemon",
+    "DaemonBuilder": ".daemon.builder",
+    "DaemonClient": ".client",
+    "AsyncDaemonClient": ".client",
+    "GRPCDaemonClient": ".client.grpc_client",
+    "AsyncGRPCDaemonClient": ".client.async_grpc_client",
+    "DaemonConfig": ".config",
+    "task_handler": ".core",
+    "get_all_handlers": ".core",
+    "Queue": ".core",
+    "PersistentQueue": ".core",
+    "MemoryQueue": ".core",
+}
+
+
+def __getattr__(name):
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Cache on the module so __getattr__ only fires once per symbol
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -1,46 +1,82 @@
 #!/usr/bin/env python3
 """CLI entry point for TaskDaemon."""
 
-import argparse
+import dataclasses
 import sys
-from .daemon import TaskDaemon
-from .config import DaemonConfig
+
+_USAGE = """\
+usage: python -m task_daemon [options]
+
+TaskDaemon - Configurable task processing system
+
+options:
+  --host HOST          Host to bind to
+  --port PORT          Port to bind to
+  --workers N          Number of worker threads
+  --db-path PATH       Database path
+  --log-level LEVEL    Log level
+  --config-from-env    Load config from environment
+  -h, --help           Show this help message and exit
+"""
+
+# CLI flag -> (DaemonConfig field, value converter). Parsed by hand so
+# startup doesn't pay for building an argparse parser on every spawn.
+_FLAGS = {
+    "--host": ("host", str),
+    "--port": ("port", int),
+    "--workers": ("worker_threads", int),
+    "--db-path": ("db_path", str),
+    "--log-level": ("log_level", str),
+}
+
+
+def _parse_args(argv):
+    """Parse CLI flags into (overrides dict, from_env flag)."""
+    overrides = {}
+    from_env = False
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg in ("-h", "--help"):
+            print(_USAGE)
+            sys.exit(0)
+        if arg == "--config-from-env":
+            from_env = True
+            i += 1
+            continue
+        flag, _, inline_value = arg.partition("=")
+        if flag not in _FLAGS:
+            print(f"error: unrecognized argument: {arg}\n\n{_USAGE}", file=sys.stderr)
+            sys.exit(2)
+        if not inline_value:
+            i += 1
+            if i >= len(argv):
+                print(f"error: {flag} expects a value", file=sys.stderr)
+                sys.exit(2)
+            inline_value = argv[i]
+        field, convert = _FLAGS[flag]
+        try:
+            overrides[field] = convert(inline_value)
+        except ValueError:
+            print(f"error: invalid value for {flag}: {inline_value}", file=sys.stderr)
+            sys.exit(2)
+        i += 1
+    return overrides, from_env
 
 
 def main():
-    parser = argparse.ArgumentParser(
-        description="TaskDaemon - Configurable task processing system"
-    )
-    parser.add_argument("--host", default=None, help="Host to bind to")
-    parser.add_argument("--port", type=int, default=None, help="Port to bind to")
-    parser.add_argument(
-        "--workers", type=int, default=None, help="Number of worker threads"
-    )
-    parser.add_argument("--db-path", default=None, help="Database path")
-    parser.add_argument("--log-level", default=None, help="Log level")
-    parser.add_argument(
-        "--config-from-env", action="store_true", help="Load config from environment"
-    )
-
-    args = parser.parse_args()
+    overrides, from_env = _parse_args(sys.argv[1:])
+
+    # Deferred so --help never imports the daemon (FastAPI and friends)
+    from .daemon import TaskDaemon
+    from .config import DaemonConfig
 
     # Create config
-    if args.config_from_env:
-        config = DaemonConfig.from_env()
-    else:
-        config = DaemonConfig()
-
-    # Override with CLI args
-    if args.host:
-        config.host = args.host
-    if args.port:
-        config.port = args.port
-    if args.workers:
-        config.worker_threads = args.workers
-    if args.db_path:
-        config.db_path = args.db_path
-    if args.log_level:
-        config.log_level = args.log_level
+    config = DaemonConfig.from_env() if from_env else DaemonConfig()
+
+    # Override with CLI args (config is frozen, so derive a copy)
+    if overrides:
+        config = dataclasses.replace(config, **overrides)
 
     # Start daemon
     daemon = TaskDaemon(config)
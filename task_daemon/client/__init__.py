@@ -1,6 +1,13 @@
 """Client module for TaskDaemon."""
 
 from .client import DaemonClient
+from .async_client import AsyncDaemonClient
 from .models import HealthStatus, TaskInfo, MetricsSummary
 
-__all__ = ["DaemonClient", "HealthStatus", "TaskInfo", "MetricsSummary"]
+__all__ = [
+    "DaemonClient",
+    "AsyncDaemonClient",
+    "HealthStatus",
+    "TaskInfo",
+    "MetricsSummary",
+]
@@ -0,0 +1,215 @@
+"""Async client for interacting with TaskDaemon."""
+
+import logging
+from typing import Optional, List, Dict, Any, Tuple
+
+import httpx
+from pydantic import BaseModel
+
+from .models import HealthStatus, TaskInfo, MetricsSummary, TASK_LIST_ADAPTER
+from ..protocols import get_protocol, Protocol
+
+
+def _parse_task(raw: Dict[str, Any]) -> TaskInfo:
+    """Validate a raw task dict; embedded JSON fields decode lazily."""
+    return TaskInfo.model_validate(raw)
+
+
+class AsyncDaemonClient:
+    """Asyncio client for TaskDaemon built on httpx.
+
+    Mirrors DaemonClient so callers can fan out many queue_task /
+    await_task pairs concurrently with asyncio.gather: wall time becomes
+    roughly max(latency) instead of sum(latency).
+    """
+
+    def __init__(
+        self,
+        daemon_url: str = "http://localhost:8080",
+        timeout: float = 5.0,
+        protocol: str = "json",
+    ):
+        self.daemon_url = daemon_url.rstrip("/")
+        self.timeout = timeout
+        self.protocol: Protocol = get_protocol(f"application/{protocol}")
+        self.logger = logging.getLogger(__name__)
+        self._client = httpx.AsyncClient(
+            base_url=self.daemon_url,
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=128, max_keepalive_connections=64),
+            headers={"Accept": f"{self.protocol.content_type}, application/json;q=0.5"},
+        )
+
+    async def close(self):
+        """Close the underlying connection pool."""
+        await self._client.aclose()
+
+    # httpx-style alias
+    aclose = close
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def queue_task(
+        self, task_type: str, *args: Any, critical: bool = True, **kwargs: Any
+    ) -> Optional[int]:
+        """Queue a task for processing. Same call shapes as DaemonClient."""
+        try:
+            if args and len(args) == 1 and isinstance(args[0], (dict, BaseModel)):
+                task_data = args[0]
+            elif args:
+                task_data = {"args": args}
+            elif kwargs:
+                task_data = kwargs
+            else:
+                task_data = None
+
+            data = (
+                task_data.model_dump()
+                if isinstance(task_data, BaseModel)
+                else task_data
+            )
+            body = self.protocol.serialize({"type": task_type, "data": data})
+
+            response = await self._client.post(
+                "/queue",
+                content=body,
+                headers={"Content-Type": self.protocol.content_type},
+            )
+            if response.status_code == 200:
+                result = self.protocol.deserialize(response.content)
+                return result.get("task_id")
+            self.logger.warning(f"Failed to queue task: {response.status_code}")
+        except Exception as e:
+            self.logger.warning(f"Failed to queue task: {e}")
+            if critical:
+                raise
+        return None
+
+    async def queue_tasks(
+        self, tasks: List[Tuple[str, Any]], *, critical: bool = True
+    ) -> List[Optional[int]]:
+        """Queue several tasks in one round-trip."""
+        try:
+            entries = []
+            for task_type, task_data in tasks:
+                data = (
+                    task_data.model_dump()
+                    if isinstance(task_data, BaseModel)
+                    else task_data
+                )
+                entries.append({"type": task_type, "data": data})
+
+            body = self.protocol.serialize({"tasks": entries})
+            response = await self._client.post(
+                "/queue/batch",
+                content=body,
+                headers={"Content-Type": self.protocol.content_type},
+            )
+            if response.status_code == 200:
+                result = self.protocol.deserialize(response.content)
+                return result.get("task_ids") or []
+            self.logger.warning(f"Failed to queue batch: {response.status_code}")
+        except Exception as e:
+            self.logger.warning(f"Failed to queue batch: {e}")
+            if critical:
+                raise
+        return []
+
+    async def health_check(self) -> HealthStatus:
+        """Check daemon health status."""
+        try:
+            response = await self._client.get("/health")
+            return HealthStatus.model_validate(response.json())
+        except Exception as e:
+            self.logger.debug(f"Health check failed: {e}")
+            return HealthStatus(
+                status="unhealthy", queue_size=0, timestamp="", workers=0
+            )
+
+    async def get_metrics(self) -> MetricsSummary:
+        """Get daemon metrics."""
+        try:
+            response = await self._client.get("/api/metrics")
+            return MetricsSummary.model_validate(response.json())
+        except Exception as e:
+            self.logger.debug(f"Metrics request failed: {e}")
+            return MetricsSummary(
+                tasks_received=0,
+                tasks_processed=0,
+                tasks_failed=0,
+                queue_size=0,
+                workers=0,
+            )
+
+    async def get_tasks(self, limit: int = 20) -> List[TaskInfo]:
+        """Get recent tasks."""
+        try:
+            response = await self._client.get("/api/tasks", params={"limit": limit})
+            return TASK_LIST_ADAPTER.validate_json(response.content)
+        except Exception as e:
+            self.logger.debug(f"Tasks request failed: {e}")
+            return []
+
+    async def get_tasks_by_ids(self, task_ids: List[int]) -> Dict[int, TaskInfo]:
+        """Fetch several tasks in one round-trip, keyed by ID."""
+        try:
+            response = await self._client.post(
+                "/api/tasks/batch", json={"ids": task_ids}
+            )
+            if response.status_code == 200:
+                tasks = TASK_LIST_ADAPTER.validate_json(response.content)
+                return {task.id: task for task in tasks}
+            return {}
+        except Exception as e:
+            self.logger.debug(f"Batch task request failed: {e}")
+            return {}
+
+    async def get_task(self, task_id: int) -> Optional[TaskInfo]:
+        """Get task by ID with all metadata."""
+        try:
+            response = await self._client.get(f"/api/tasks/{task_id}")
+            if response.status_code == 200:
+                return _parse_task(response.json())
+            return None
+        except Exception as e:
+            self.logger.debug(f"Get task request failed: {e}")
+            return None
+
+    async def await_task(
+        self, task_id: int, timeout: float = 30.0
+    ) -> Optional[TaskInfo]:
+        """Block until a task reaches a terminal state (or timeout)."""
+        try:
+            response = await self._client.get(
+                f"/api/tasks/{task_id}/wait",
+                params={"timeout": timeout},
+                timeout=timeout + 5.0,
+            )
+            if response.status_code == 200:
+                return _parse_task(response.json())
+            return None
+        except Exception as e:
+            self.logger.debug(f"Await task request failed: {e}")
+            return None
+
+    async def delete_task(self, task_id: int) -> bool:
+        """Delete task from queue. Returns True if successful."""
+        try:
+            response = await self._client.delete(f"/api/tasks/{task_id}")
+            return response.status_code == 200
+        except Exception as e:
+            self.logger.debug(f"Delete task request failed: {e}")
+            return False
+
+    async def redrive_task(self, task_id: int) -> bool:
+        """Redrive a failed task. Returns True if successful."""
+        try:
+            response = await self._client.post(f"/api/tasks/{task_id}/redrive")
+            return response.status_code == 200
+        except Exception as e:
+            self.logger.debug(f"Redrive task request failed: {e}")
+            return False
@@ -0,0 +1,247 @@
+"""Async gRPC client for TaskDaemon."""
+
+import grpc
+import grpc.aio
+from typing import Optional, List, Dict, Any
+
+from ..proto import task_daemon_pb2, task_daemon_pb2_grpc
+from ..protocols import get_protocol_by_name
+
+# Tuned for long-lived, highly concurrent channels: keepalives hold the
+# connection open across idle gaps and HTTP/2 multiplexes many in-flight
+# RPCs on it without extra sockets.
+_CHANNEL_OPTIONS = [
+    ("grpc.keepalive_time_ms", 30000),
+    ("grpc.max_concurrent_streams", 1000),
+    ("grpc.http2.max_pings_without_data", 0),
+]
+
+
+class AsyncGRPCDaemonClient:
+    """Asyncio gRPC client for TaskDaemon.
+
+    Mirrors GRPCDaemonClient, but awaiting the stub lets callers pipeline
+    many RPCs concurrently over one HTTP/2 connection instead of blocking
+    a thread per call.
+    """
+
+    def __init__(self, address: str = "localhost:50051", protocol: str = "json"):
+        """Initialize async gRPC client.
+
+        Args:
+            address: gRPC server address (host:port)
+            protocol: Protocol for task data serialization ("json" or "msgpack")
+        """
+        self.address = address
+        self.protocol_name = protocol
+        self.protocol = get_protocol_by_name(protocol)
+        # Gzip matches the server default; task payloads are JSON or
+        # msgpack text that compresses 3-5x on the wire.
+        self.channel = grpc.aio.insecure_channel(
+            address, options=_CHANNEL_OPTIONS, compression=grpc.Compression.Gzip
+        )
+        self.stub = task_daemon_pb2_grpc.TaskDaemonStub(self.channel)
+
+    async def close(self):
+        """Close the gRPC channel."""
+        await self.channel.close()
+
+    def _task_to_dict(self, task) -> Dict[str, Any]:
+        """Convert a proto TaskInfo to a plain dict."""
+        task_data = (
+            self.protocol.deserialize(task.task_data) if task.task_data else None
+        )
+        result = self.protocol.deserialize(task.result) if task.result else None
+
+        return {
+            "id": task.id,
+            "task_type": task.task_type,
+            "task_data": task_data,
+            "status": task.status,
+            "created_at": task.created_at,
+            "completed_at": task.completed_at,
+            "attempts": task.attempts,
+            "last_error": task.last_error,
+            "result": result,
+        }
+
+    async def queue_task(
+        self, task_type: str, task_data: Optional[Dict[str, Any]] = None
+    ) -> Optional[int]:
+        """Queue a task.
+
+        Args:
+            task_type: Type of task
+            task_data: Task data (will be serialized using configured protocol)
+
+        Returns:
+            Task ID if successful, None otherwise
+        """
+        try:
+            request = task_daemon_pb2.TaskRequest(
+                task_type=task_type,
+                task_data=self.protocol.serialize(task_data or {}),
+            )
+            response = await self.stub.QueueTask(request)
+            return response.task_id
+        except grpc.RpcError as e:
+            print(f"gRPC error: {e.code()}: {e.details()}")
+            return None
+
+    async def queue_tasks(self, tasks) -> List[int]:
+        """Queue several tasks in one client-streaming RPC.
+
+        Args:
+            tasks: List of (task_type, task_data) pairs
+
+        Returns:
+            List of assigned task IDs (empty on error)
+        """
+        try:
+
+            async def requests():
+                for task_type, task_data in tasks:
+                    yield task_daemon_pb2.TaskRequest(
+                        task_type=task_type,
+                        task_data=self.protocol.serialize(task_data or {}),
+                    )
+
+            response = await self.stub.QueueTaskBatch(requests())
+            return list(response.task_ids)
+        except grpc.RpcError as e:
+            print(f"gRPC error: {e.code()}: {e.details()}")
+            return []
+
+    async def get_task(self, task_id: int) -> Optional[Dict[str, Any]]:
+        """Get task information.
+
+        Args:
+            task_id: Task ID
+
+        Returns:
+            Task information dict or None
+        """
+        try:
+            request = task_daemon_pb2.TaskIdRequest(task_id=task_id)
+            response = await self.stub.GetTask(request)
+            return self._task_to_dict(response)
+        except grpc.RpcError as e:
+            print(f"gRPC error: {e.code()}: {e.details()}")
+            return None
+
+    async def get_tasks_by_ids(self, task_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """Get several tasks in one RPC, keyed by ID.
+
+        Args:
+            task_ids: Task IDs to fetch
+
+        Returns:
+            Dict mapping task ID to task dict (missing IDs are absent)
+        """
+        try:
+            request = task_daemon_pb2.TaskIdList(task_ids=task_ids)
+            response = await self.stub.GetTasks(request)
+            return {task.id: self._task_to_dict(task) for task in response.tasks}
+        except grpc.RpcError as e:
+            print(f"gRPC error: {e.code()}: {e.details()}")
+            return {}
+
+    async def get_health(self) -> Optional[Dict[str, Any]]:
+        """Get health status.
+
+        Returns:
+            Health status dict or None
+        """
+        try:
+            request = task_daemon_pb2.Empty()
+            response = await self.stub.GetHealth(request)
+            return {
+                "status": response.status,
+                "queue_size": response.queue_size,
+                "timestamp": response.timestamp,
+                "workers": response.workers,
+            }
+        except grpc.RpcError as e:
+            print(f"gRPC error: {e.code()}: {e.details()}")
+            return None
+
+    async def get_metrics(self) -> Optional[Dict[str, Any]]:
+        """Get metrics summary.
+
+        Returns:
+            Metrics dict or None
+        """
+        try:
+            request = task_daemon_pb2.Empty()
+            response = await self.stub.GetMetrics(request)
+            return {
+                "tasks_received": response.tasks_received,
+                "tasks_processed_success": response.tasks_processed_success,
+                "tasks_processed_failed": response.tasks_processed_failed,
+                "queue_size": response.queue_size,
+                "daemon_healthy": response.daemon_healthy,
+            }
+        except grpc.RpcError as e:
+            print(f"gRPC error: {e.code()}: {e.details()}")
+            return None
+
+    async def list_tasks(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """List recent tasks.
+
+        Args:
+            limit: Maximum number of tasks to return
+
+        Returns:
+            List of task dicts
+        """
+        try:
+            request = task_daemon_pb2.ListTasksRequest(limit=limit)
+            # Server-streaming RPC: tasks arrive one at a time
+            return [
+                self._task_to_dict(task) async for task in self.stub.ListTasks(request)
+            ]
+        except grpc.RpcError as e:
+            print(f"gRPC error: {e.code()}: {e.details()}")
+            return []
+
+    async def delete_task(self, task_id: int) -> bool:
+        """Delete a task.
+
+        Args:
+            task_id: Task ID
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            request = task_daemon_pb2.TaskIdRequest(task_id=task_id)
+            response = await self.stub.DeleteTask(request)
+            return response.success
+        except grpc.RpcError as e:
+            print(f"gRPC error: {e.code()}: {e.details()}")
+            return False
+
+    async def redrive_task(self, task_id: int) -> bool:
+        """Redrive a failed task.
+
+        Args:
+            task_id: Task ID
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            request = task_daemon_pb2.TaskIdRequest(task_id=task_id)
+            response = await self.stub.RedriveTask(request)
+            return response.success
+        except grpc.RpcError as e:
+            print(f"gRPC error: {e.code()}: {e.details()}")
+            return False
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
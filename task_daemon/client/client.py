@@ -1,29 +1,161 @@
 """Client for interacting with TaskDaemon."""
 
-import requests
 import logging
-from typing import Optional, List, Dict, Any, TypeVar, overload
+import threading
+import time
+from typing import Callable, Optional, List, Dict, Any, Tuple, TypeVar, overload
+
+import orjson
+import urllib3
 from pydantic import BaseModel
 
-from .models import HealthStatus, TaskInfo, MetricsSummary
+from .models import HealthStatus, TaskInfo, MetricsSummary, TASK_LIST_ADAPTER
 from ..protocols import get_protocol, Protocol
 
 T = TypeVar("T", bound=BaseModel)
 
+# orjson is a hard dependency; decode response bytes with its C parser
+# instead of response.json()'s stdlib path.
+_LOADS = orjson.loads
+
+
+class _TokenBucket:
+    """Thread-safe token bucket for client-side admission control.
+
+    Smooths enqueue bursts to a sustainable rate so the daemon's queue
+    doesn't backlog; callers block briefly instead of overrunning it.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.capacity = float(burst)
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available, then consume it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity, self.tokens + (now - self.updated) * self.rate
+                )
+                self.updated = now
+                if self.tokens >= 1.0:
+                    self.tokens -= 1.0
+                    return
+                wait = (1.0 - self.tokens) / self.rate
+            time.sleep(wait)
+
 
 class DaemonClient:
-    """Client for interacting with TaskDaemon service."""
+    """Client for interacting with TaskDaemon service.
+
+    All HTTP calls go through one urllib3.PoolManager, so repeated
+    calls reuse keep-alive sockets instead of handshaking per request,
+    without the per-call PreparedRequest/cookie/hook machinery that
+    requests layers on top. Use as a context manager (or call close())
+    to release the pool deterministically.
+    """
 
     def __init__(
         self,
         daemon_url: str = "http://localhost:8080",
         timeout: float = 0.1,
         protocol: str = "json",
+        max_qps: Optional[float] = None,
+        burst: Optional[int] = None,
+        cache_ttls: Optional[Dict[str, float]] = None,
     ):
         self.daemon_url = daemon_url.rstrip("/")
         self.timeout = timeout
+        # Optional rate limit on enqueue requests (None = unthrottled)
+        self._bucket = (
+            _TokenBucket(max_qps, burst or max(1, int(max_qps))) if max_qps else None
+        )
         self.protocol: Protocol = get_protocol(f"application/{protocol}")
         self.logger = logging.getLogger(__name__)
+        # Pooled keep-alive connections straight on urllib3; the Accept
+        # header advertises the preferred wire format (msgpack clients
+        # still accept JSON so curl-style servers keep working).
+        self._http = urllib3.PoolManager(
+            num_pools=4,
+            maxsize=128,
+            retries=False,
+            headers={
+                "Accept": f"{self.protocol.content_type}, application/json;q=0.5",
+            },
+        )
+        # One Timeout object reused by every standard-timeout request
+        self._timeout = urllib3.Timeout(total=timeout)
+        # Built once; queue_task would otherwise rebuild this per call
+        self._content_headers = {"Content-Type": self.protocol.content_type}
+        # Bound-method hoisting: protocols are fixed for the life of the
+        # client, so skip two attribute lookups per call on the hot path
+        self._serialize = self.protocol.serialize
+        self._deserialize = self.protocol.deserialize
+        # Endpoint URLs, formatted once instead of per call
+        self._url_queue = self.daemon_url + "/queue"
+        self._url_queue_batch = self.daemon_url + "/queue/batch"
+        self._url_health = self.daemon_url + "/health"
+        self._url_metrics = self.daemon_url + "/metrics"
+        self._url_api_metrics = self.daemon_url + "/api/metrics"
+        self._url_tasks = self.daemon_url + "/api/tasks"
+        self._url_tasks_batch = self.daemon_url + "/api/tasks/batch"
+        # Conditional-request cache for get_tasks: last ETag and parsed
+        # body per limit, so unchanged polls cost a 304 instead of a
+        # SQLite read plus JSON decode.
+        self._tasks_etag: Dict[int, str] = {}
+        self._tasks_cache: Dict[int, List[TaskInfo]] = {}
+        # Process-local short-circuit: if this client hasn't mutated the
+        # queue since a very recent fetch for a given limit, reuse the
+        # parsed result without any HTTP round-trip at all. The short
+        # TTL bounds staleness from server-side state changes (workers
+        # completing tasks) that this client can't observe.
+        self._mutation_seq = 0
+        self._tasks_fetched: Dict[int, Tuple[int, float]] = {}
+        self._tasks_cache_ttl = 1.0
+        # TTL cache for scrape-style endpoints whose answers are stable
+        # for seconds; cache_ttls overrides per key ("health", "metrics",
+        # "prometheus"), 0 disables caching for that key.
+        self._cache_ttls = {"health": 1.0, "metrics": 2.0, "prometheus": 5.0}
+        if cache_ttls:
+            self._cache_ttls.update(cache_ttls)
+        self._method_cache: Dict[str, Tuple[float, Any]] = {}
+        self._cache_lock = threading.Lock()
+
+    def _cached(
+        self, key: str, fetch: Callable[[], Any], variant: Optional[str] = None
+    ) -> Any:
+        """Return the cached value for key if still fresh, else refetch.
+
+        variant separates differently-shaped results (e.g. raw dicts vs
+        typed models) that share one TTL. Only the dict lookup/swap is
+        under the lock, so a slow fetch never blocks other cached methods.
+        """
+        ttl = self._cache_ttls[key]
+        if variant:
+            key = key + ":" + variant
+        now = time.monotonic()
+        with self._cache_lock:
+            entry = self._method_cache.get(key)
+            if entry and now - entry[0] < ttl:
+                return entry[1]
+        value = fetch()
+        with self._cache_lock:
+            self._method_cache[key] = (time.monotonic(), value)
+        return value
+
+    def close(self):
+        """Close the underlying connection pool."""
+        self._http.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
 
     @overload
     def queue_task(
@@ -60,6 +192,8 @@ class DaemonClient:
             queue_task("add", a=1, b=2)  # Kwargs
             queue_task("add", 1, 2)  # Positional (converted to dict with param names)
         """
+        if self._bucket:
+            self._bucket.acquire()
         try:
             # Determine task_data format
             if args and len(args) == 1 and isinstance(args[0], (dict, BaseModel)):
@@ -84,23 +218,24 @@ class DaemonClient:
             payload = {"type": task_type, "data": data}
 
             # Serialize with protocol
-            body = self.protocol.serialize(payload)
-            headers = {"Content-Type": self.protocol.content_type}
+            body = self._serialize(payload)
 
-            response = requests.post(
-                f"{self.daemon_url}/queue",
-                data=body,
-                headers=headers,
-                timeout=self.timeout,
+            response = self._http.request(
+                "POST",
+                self._url_queue,
+                body=body,
+                headers=self._content_headers,
+                timeout=self._timeout,
             )
-            if response.status_code == 200:
+            if response.status == 200:
                 # Deserialize response with same protocol
-                result = self.protocol.deserialize(response.content)
+                result = self._deserialize(response.data)
+                self._mutation_seq += 1
                 return result.get("task_id")
             else:
-                self.logger.warning(f"Failed to queue task: {response.status_code}")
-                if response.status_code == 422:
-                    self.logger.warning(f"Validation error: {response.text}")
+                self.logger.warning(f"Failed to queue task: {response.status}")
+                if response.status == 422:
+                    self.logger.warning(f"Validation error: {response.data.decode()}")
 
         except Exception as e:
             self.logger.warning(f"Failed to queue task: {e}")
@@ -108,24 +243,106 @@ class DaemonClient:
                 raise
         return None
 
-    def health_check(self) -> HealthStatus:
-        """Check daemon health status."""
+    def queue_tasks(
+        self, tasks: List[Tuple[str, Any]], *, critical: bool = True
+    ) -> List[Optional[int]]:
+        """Queue several tasks in one round-trip.
+
+        Args:
+            tasks: List of (task_type, task_data) pairs
+            critical: If True, raises exception on failure
+
+        Returns:
+            List of task IDs (empty on failure unless critical=True)
+        """
+        if self._bucket:
+            self._bucket.acquire()
+        try:
+            entries = []
+            for task_type, task_data in tasks:
+                data = (
+                    task_data.model_dump()
+                    if isinstance(task_data, BaseModel)
+                    else task_data
+                )
+                entries.append({"type": task_type, "data": data})
+
+            body = self._serialize({"tasks": entries})
+
+            response = self._http.request(
+                "POST",
+                self._url_queue_batch,
+                body=body,
+                headers=self._content_headers,
+                timeout=self._timeout,
+            )
+            if response.status == 200:
+                result = self._deserialize(response.data)
+                self._mutation_seq += 1
+                return result.get("task_ids") or []
+            self.logger.warning(f"Failed to queue batch: {response.status}")
+        except Exception as e:
+            self.logger.warning(f"Failed to queue batch: {e}")
+            if critical:
+                raise
+        return []
+
+    def health_check(self, raw: bool = False):
+        """Check daemon health status (cached briefly, see cache_ttls).
+
+        With raw=True the deserialized dict is returned as-is, skipping
+        model construction for callers that only read a field or two.
+        """
+        if raw:
+            return self._cached("health", self._fetch_health_raw, variant="raw")
+        return self._cached("health", self._fetch_health)
+
+    def _fetch_health_raw(self) -> Dict[str, Any]:
         try:
-            response = requests.get(f"{self.daemon_url}/health", timeout=self.timeout)
-            return HealthStatus.model_validate(response.json())
+            response = self._http.request(
+                "GET", self._url_health, timeout=self._timeout
+            )
+            return _LOADS(response.data)
         except Exception as e:
             self.logger.debug(f"Health check failed: {e}")
-            return HealthStatus(
-                status="unhealthy", queue_size=0, timestamp="", workers=0
+            return {
+                "status": "unhealthy",
+                "queue_size": 0,
+                "timestamp": "",
+                "workers": 0,
+            }
+
+    def _fetch_health(self) -> HealthStatus:
+        # The daemon's own response is trusted, so model_construct skips
+        # the validation pass on the typed path too.
+        return HealthStatus.model_construct(**self._fetch_health_raw())
+
+    def get_metrics(self, raw: bool = False):
+        """Get daemon metrics (cached briefly, see cache_ttls).
+
+        With raw=True the deserialized dict is returned as-is, skipping
+        model construction for callers that only read a field or two.
+        """
+        if raw:
+            return self._cached("metrics", self._fetch_metrics_raw, variant="raw")
+        return self._cached("metrics", self._fetch_metrics)
+
+    def _fetch_metrics_raw(self) -> Dict[str, Any]:
+        try:
+            response = self._http.request(
+                "GET", self._url_api_metrics, timeout=self._timeout
             )
+            return _LOADS(response.data)
+        except Exception as e:
+            self.logger.debug(f"Metrics request failed: {e}")
+            return {}
 
-    def get_metrics(self) -> MetricsSummary:
-        """Get daemon metrics."""
+    def _fetch_metrics(self) -> MetricsSummary:
         try:
-            response = requests.get(
-                f"{self.daemon_url}/api/metrics", timeout=self.timeout
+            response = self._http.request(
+                "GET", self._url_api_metrics, timeout=self._timeout
             )
-            return MetricsSummary.model_validate(response.json())
+            return MetricsSummary.model_validate(_LOADS(response.data))
         except Exception as e:
             self.logger.debug(f"Metrics request failed: {e}")
             return MetricsSummary(
@@ -139,32 +356,75 @@ class DaemonClient:
     def get_tasks(self, limit: int = 20) -> List[TaskInfo]:
         """Get recent tasks."""
         try:
-            response = requests.get(
-                f"{self.daemon_url}/api/tasks",
-                params={"limit": limit},
-                timeout=self.timeout,
+            # Nothing mutated through this client since a fresh fetch
+            # for this limit: serve straight from the local cache.
+            fetched = self._tasks_fetched.get(limit)
+            if (
+                fetched
+                and fetched[0] == self._mutation_seq
+                and time.monotonic() - fetched[1] < self._tasks_cache_ttl
+            ):
+                return self._tasks_cache.get(limit, [])
+            headers = {}
+            etag = self._tasks_etag.get(limit)
+            if etag:
+                headers["If-None-Match"] = etag
+            response = self._http.request(
+                "GET",
+                self._url_tasks,
+                fields={"limit": limit},
+                headers=headers,
+                timeout=self._timeout,
             )
-            tasks = response.json()
-            # Parse JSON strings in task_data and result fields
-            for task in tasks:
-                if task.get("task_data") and isinstance(task["task_data"], str):
-                    import json
-
-                    task["task_data"] = json.loads(task["task_data"])
-                if task.get("result") and isinstance(task["result"], str):
-                    import json
-
-                    task["result"] = json.loads(task["result"])
-            return [TaskInfo.model_validate(task) for task in tasks]
+            if response.status == 304:
+                # Server confirmed the cached body is still current
+                self._tasks_fetched[limit] = (self._mutation_seq, time.monotonic())
+                return self._tasks_cache.get(limit, [])
+            # One pydantic-core call validates the whole list straight
+            # from the response bytes; embedded task_data/result JSON
+            # stays raw and decodes lazily on first parsed_* access.
+            parsed = TASK_LIST_ADAPTER.validate_json(response.data)
+            etag = response.headers.get("ETag")
+            if etag:
+                self._tasks_etag[limit] = etag
+                self._tasks_cache[limit] = parsed
+                self._tasks_fetched[limit] = (self._mutation_seq, time.monotonic())
+            return parsed
         except Exception as e:
             self.logger.debug(f"Tasks request failed: {e}")
             return []
 
+    def get_tasks_by_ids(self, task_ids: List[int]) -> Dict[int, TaskInfo]:
+        """Fetch several tasks in one round-trip, keyed by ID.
+
+        Replaces N get_task calls (N RTTs) with a single batch request.
+        IDs the daemon no longer knows are simply absent from the result.
+        """
+        try:
+            response = self._http.request(
+                "POST",
+                self._url_tasks_batch,
+                json={"ids": task_ids},
+                timeout=self._timeout,
+            )
+            if response.status == 200:
+                tasks = TASK_LIST_ADAPTER.validate_json(response.data)
+                return {task.id: task for task in tasks}
+            return {}
+        except Exception as e:
+            self.logger.debug(f"Batch task request failed: {e}")
+            return {}
+
     def get_prometheus_metrics(self) -> str:
-        """Get Prometheus formatted metrics."""
+        """Get Prometheus formatted metrics (cached briefly, see cache_ttls)."""
+        return self._cached("prometheus", self._fetch_prometheus_metrics)
+
+    def _fetch_prometheus_metrics(self) -> str:
         try:
-            response = requests.get(f"{self.daemon_url}/metrics", timeout=self.timeout)
-            return response.text
+            response = self._http.request(
+                "GET", self._url_metrics, timeout=self._timeout
+            )
+            return response.data.decode()
         except Exception as e:
             self.logger.debug(f"Prometheus metrics request failed: {e}")
             return ""
@@ -172,33 +432,46 @@ class DaemonClient:
     def get_task(self, task_id: int) -> Optional[TaskInfo]:
         """Get task by ID with all metadata."""
         try:
-            response = requests.get(
-                f"{self.daemon_url}/api/tasks/{task_id}", timeout=self.timeout
+            response = self._http.request(
+                "GET", self._url_tasks + "/" + str(task_id), timeout=self._timeout
             )
-            if response.status_code == 200:
-                raw_data = response.json()
-                # Parse JSON strings in task_data and result fields
-                if raw_data.get("task_data") and isinstance(raw_data["task_data"], str):
-                    import json
-
-                    raw_data["task_data"] = json.loads(raw_data["task_data"])
-                if raw_data.get("result") and isinstance(raw_data["result"], str):
-                    import json
-
-                    raw_data["result"] = json.loads(raw_data["result"])
-                return TaskInfo.model_validate(raw_data)
+            if response.status == 200:
+                return TaskInfo.model_validate(_LOADS(response.data))
             return None
         except Exception as e:
             self.logger.debug(f"Get task request failed: {e}")
             return None
 
+    def await_task(self, task_id: int, timeout: float = 30.0) -> Optional[TaskInfo]:
+        """Block until a task reaches a terminal state (or timeout).
+
+        Uses the daemon's long-poll endpoint instead of sleep-and-poll
+        loops, so completion is observed as soon as the worker commits it.
+        """
+        try:
+            response = self._http.request(
+                "GET",
+                self._url_tasks + "/" + str(task_id) + "/wait",
+                fields={"timeout": timeout},
+                timeout=urllib3.Timeout(total=timeout + 5.0),
+            )
+            if response.status == 200:
+                return TaskInfo.model_validate(_LOADS(response.data))
+            return None
+        except Exception as e:
+            self.logger.debug(f"Await task request failed: {e}")
+            return None
+
     def delete_task(self, task_id: int) -> bool:
         """Delete task from queue. Returns True if successful."""
         try:
-            response = requests.delete(
-                f"{self.daemon_url}/api/tasks/{task_id}", timeout=self.timeout
+            response = self._http.request(
+                "DELETE", self._url_tasks + "/" + str(task_id), timeout=self._timeout
             )
-            return response.status_code == 200
+            if response.status == 200:
+                self._mutation_seq += 1
+                return True
+            return False
         except Exception as e:
             self.logger.debug(f"Delete task request failed: {e}")
             return False
@@ -206,10 +479,15 @@ class DaemonClient:
     def redrive_task(self, task_id: int) -> bool:
         """Redrive a failed task. Returns True if successful."""
         try:
-            response = requests.post(
-                f"{self.daemon_url}/api/tasks/{task_id}/redrive", timeout=self.timeout
+            response = self._http.request(
+                "POST",
+                self._url_tasks + "/" + str(task_id) + "/redrive",
+                timeout=self._timeout,
             )
-            return response.status_code == 200
+            if response.status == 200:
+                self._mutation_seq += 1
+                return True
+            return False
         except Exception as e:
             self.logger.debug(f"Redrive task request failed: {e}")
             return False
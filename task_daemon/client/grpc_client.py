@@ -1,11 +1,14 @@
 """gRPC client for TaskDaemon."""
 
 import grpc
-import base64
+import itertools
 from typing import Optional, List, Dict, Any
 
 from ..proto import task_daemon_pb2, task_daemon_pb2_grpc
-from ..protocols import JSONProtocol, MessagePackProtocol
+from ..protocols import get_protocol_by_name
+
+# Number of pooled channels per client
+_POOL_SIZE = 4
 
 
 class GRPCDaemonClient:
@@ -20,15 +23,35 @@ class GRPCDaemonClient:
         """
         self.address = address
         self.protocol_name = protocol
-        self.protocol = (
-            MessagePackProtocol() if protocol == "msgpack" else JSONProtocol()
-        )
-        self.channel = grpc.insecure_channel(address)
-        self.stub = task_daemon_pb2_grpc.TaskDaemonStub(self.channel)
+        self.protocol = get_protocol_by_name(protocol)
+        # A small pool of channels, each forced onto its own TCP
+        # connection, spreads concurrent RPCs across HTTP/2 streams so
+        # one congested connection doesn't head-of-line-block the rest.
+        # Gzip matches the server default; task payloads are JSON or
+        # msgpack text that compresses 3-5x on the wire.
+        self._channels = [
+            grpc.insecure_channel(
+                address,
+                options=[("grpc.use_local_subchannel_pool", 1)],
+                compression=grpc.Compression.Gzip,
+            )
+            for _ in range(_POOL_SIZE)
+        ]
+        self._stubs = [
+            task_daemon_pb2_grpc.TaskDaemonStub(channel) for channel in self._channels
+        ]
+        # itertools.count is atomic under the GIL; no lock for rotation
+        self._counter = itertools.count()
+
+    @property
+    def stub(self) -> task_daemon_pb2_grpc.TaskDaemonStub:
+        """Next stub in round-robin order."""
+        return self._stubs[next(self._counter) % _POOL_SIZE]
 
     def close(self):
-        """Close the gRPC channel."""
-        self.channel.close()
+        """Close every pooled gRPC channel."""
+        for channel in self._channels:
+            channel.close()
 
     def queue_task(
         self, task_type: str, task_data: Optional[Dict[str, Any]] = None
@@ -43,17 +66,12 @@ class GRPCDaemonClient:
             Task ID if successful, None otherwise
         """
         try:
-            # Serialize using configured protocol
+            # Serialize using configured protocol; the bytes field passes
+            # straight through protobuf, no base64 detour.
             data_bytes = self.protocol.serialize(task_data or {})
 
-            # For msgpack, use base64 encoding since protobuf string field expects UTF-8
-            if self.protocol_name == "msgpack":
-                data_str = base64.b64encode(data_bytes).decode("ascii")
-            else:
-                data_str = data_bytes.decode("utf-8")
-
             request = task_daemon_pb2.TaskRequest(
-                task_type=task_type, task_data_json=data_str
+                task_type=task_type, task_data=data_bytes
             )
             response = self.stub.QueueTask(request)
             return response.task_id
@@ -61,6 +79,49 @@ class GRPCDaemonClient:
             print(f"gRPC error: {e.code()}: {e.details()}")
             return None
 
+    def queue_tasks(self, tasks) -> List[int]:
+        """Queue several tasks in one client-streaming RPC.
+
+        Args:
+            tasks: List of (task_type, task_data) pairs
+
+        Returns:
+            List of assigned task IDs (empty on error)
+        """
+        try:
+
+            def requests():
+                for task_type, task_data in tasks:
+                    yield task_daemon_pb2.TaskRequest(
+                        task_type=task_type,
+                        task_data=self.protocol.serialize(task_data or {}),
+                    )
+
+            response = self.stub.QueueTaskBatch(requests())
+            return list(response.task_ids)
+        except grpc.RpcError as e:
+            print(f"gRPC error: {e.code()}: {e.details()}")
+            return []
+
+    def _task_to_dict(self, task) -> Dict[str, Any]:
+        """Convert a proto TaskInfo to a plain dict."""
+        task_data = (
+            self.protocol.deserialize(task.task_data) if task.task_data else None
+        )
+        result = self.protocol.deserialize(task.result) if task.result else None
+
+        return {
+            "id": task.id,
+            "task_type": task.task_type,
+            "task_data": task_data,
+            "status": task.status,
+            "created_at": task.created_at,
+            "completed_at": task.completed_at,
+            "attempts": task.attempts,
+            "last_error": task.last_error,
+            "result": result,
+        }
+
     def get_task(self, task_id: int) -> Optional[Dict[str, Any]]:
         """Get task information.
 
@@ -73,45 +134,27 @@ class GRPCDaemonClient:
         try:
             request = task_daemon_pb2.TaskIdRequest(task_id=task_id)
             response = self.stub.GetTask(request)
+            return self._task_to_dict(response)
+        except grpc.RpcError as e:
+            print(f"gRPC error: {e.code()}: {e.details()}")
+            return None
 
-            # Decode based on protocol
-            if self.protocol_name == "msgpack":
-                task_data = (
-                    self.protocol.deserialize(base64.b64decode(response.task_data))
-                    if response.task_data
-                    else None
-                )
-                result = (
-                    self.protocol.deserialize(base64.b64decode(response.result))
-                    if response.result
-                    else None
-                )
-            else:
-                task_data = (
-                    self.protocol.deserialize(response.task_data.encode())
-                    if response.task_data
-                    else None
-                )
-                result = (
-                    self.protocol.deserialize(response.result.encode())
-                    if response.result
-                    else None
-                )
+    def get_tasks_by_ids(self, task_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """Get several tasks in one RPC, keyed by ID.
 
-            return {
-                "id": response.id,
-                "task_type": response.task_type,
-                "task_data": task_data,
-                "status": response.status,
-                "created_at": response.created_at,
-                "completed_at": response.completed_at,
-                "attempts": response.attempts,
-                "last_error": response.last_error,
-                "result": result,
-            }
+        Args:
+            task_ids: Task IDs to fetch
+
+        Returns:
+            Dict mapping task ID to task dict (missing IDs are absent)
+        """
+        try:
+            request = task_daemon_pb2.TaskIdList(task_ids=task_ids)
+            response = self.stub.GetTasks(request)
+            return {task.id: self._task_to_dict(task) for task in response.tasks}
         except grpc.RpcError as e:
             print(f"gRPC error: {e.code()}: {e.details()}")
-            return None
+            return {}
 
     def get_health(self) -> Optional[Dict[str, Any]]:
         """Get health status.
@@ -163,48 +206,8 @@ class GRPCDaemonClient:
         """
         try:
             request = task_daemon_pb2.ListTasksRequest(limit=limit)
-            response = self.stub.ListTasks(request)
-
-            tasks = []
-            for task in response.tasks:
-                # Decode based on protocol
-                if self.protocol_name == "msgpack":
-                    task_data = (
-                        self.protocol.deserialize(base64.b64decode(task.task_data))
-                        if task.task_data
-                        else None
-                    )
-                    result = (
-                        self.protocol.deserialize(base64.b64decode(task.result))
-                        if task.result
-                        else None
-                    )
-                else:
-                    task_data = (
-                        self.protocol.deserialize(task.task_data.encode())
-                        if task.task_data
-                        else None
-                    )
-                    result = (
-                        self.protocol.deserialize(task.result.encode())
-                        if task.result
-                        else None
-                    )
-
-                tasks.append(
-                    {
-                        "id": task.id,
-                        "task_type": task.task_type,
-                        "task_data": task_data,
-                        "status": task.status,
-                        "created_at": task.created_at,
-                        "completed_at": task.completed_at,
-                        "attempts": task.attempts,
-                        "last_error": task.last_error,
-                        "result": result,
-                    }
-                )
-            return tasks
+            # Server-streaming RPC: tasks arrive one at a time
+            return [self._task_to_dict(task) for task in self.stub.ListTasks(request)]
         except grpc.RpcError as e:
             print(f"gRPC error: {e.code()}: {e.details()}")
             return []
@@ -1,7 +1,16 @@
 """Client response models."""
 
-from typing import Dict, Any, Optional, List
-from pydantic import BaseModel
+import json
+from functools import cached_property
+from typing import Dict, Any, List, Optional, Union
+from pydantic import BaseModel, TypeAdapter
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson is a regular dependency
+    _loads = json.loads
 
 
 class HealthStatus(BaseModel):
@@ -14,11 +23,17 @@ class HealthStatus(BaseModel):
 
 
 class TaskInfo(BaseModel):
-    """Task information."""
+    """Task information.
+
+    task_data and result may arrive as embedded JSON strings from the
+    daemon. They are kept raw and decoded once on first access through
+    parsed_task_data / parsed_result, so status polls that only look at
+    id/status never pay for payload parsing.
+    """
 
     id: int
     task_type: str
-    task_data: Optional[Dict[str, Any]]
+    task_data: Optional[Union[Dict[str, Any], str]]
     status: str
     created_at: str
     completed_at: Optional[str] = None
@@ -26,6 +41,25 @@ class TaskInfo(BaseModel):
     last_error: Optional[str] = None
     result: Optional[Any] = None
 
+    @cached_property
+    def parsed_task_data(self) -> Optional[Dict[str, Any]]:
+        """Task payload with any embedded JSON string decoded."""
+        if isinstance(self.task_data, str):
+            return _loads(self.task_data)
+        return self.task_data
+
+    @cached_property
+    def parsed_result(self) -> Any:
+        """Task result with any embedded JSON string decoded."""
+        if isinstance(self.result, str):
+            return _loads(self.result)
+        return self.result
+
+
+# Validates a whole task list (straight from response bytes) in one
+# pydantic-core call instead of a Python-level model_validate per element.
+TASK_LIST_ADAPTER = TypeAdapter(List[TaskInfo])
+
 
 class MetricsSummary(BaseModel):
     """Metrics summary."""
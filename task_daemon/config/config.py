@@ -1,20 +1,51 @@
 """Configuration management for Task Daemon."""
 
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Dict
 
 
-@dataclass
+@dataclass(frozen=True)
 class DaemonConfig:
-    """Configuration for TaskDaemon with sensible defaults."""
+    """Configuration for TaskDaemon with sensible defaults.
+
+    Frozen: values are validated once at construction and can't drift
+    while worker loops read them. Use dataclasses.replace() to derive a
+    modified copy.
+    """
 
     # Database
     db_path: str = "/tmp/task_queue.db"
+    # Row serializer for stored task payloads: "json" (default; keeps
+    # the raw validate_json fast path) or "msgpack" (binary rows,
+    # single C-level pack/unpack pass for nested payloads).
+    serializer: str = "json"
 
     # Worker settings
     worker_threads: int = 2
     max_retries: int = 3
     worker_sleep: float = 0.1
+    # Tasks claimed per dequeue round-trip; >1 amortizes queue overhead
+    # across a worker-local buffer when the backlog is deep.
+    batch_size: int = 1
+    # "thread" runs handlers on a thread pool; "async" runs them as
+    # asyncio tasks on uvicorn's event loop, where coroutine handlers
+    # fan out I/O far beyond what OS threads allow.
+    worker_mode: str = "thread"
+
+    # Retry backoff (full-jitter exponential by default)
+    retry_base: float = 1.0
+    retry_cap: float = 60.0
+    retry_jitter: str = "full"  # "full", "equal" or "none"
+
+    # Maintenance: terminal tasks older than the retention window move
+    # to the dead-letter table; maintenance runs every interval seconds.
+    retention_seconds: float = 604800.0  # 7 days
+    maintenance_interval: float = 300.0
+
+    # Scheduling: task_type -> priority (1 = highest, default 5).
+    # Lets short tasks jump the queue instead of waiting behind long ones.
+    priority_map: Dict[str, int] = field(default_factory=dict)
 
     # Server settings
     host: str = "0.0.0.0"
@@ -32,9 +63,21 @@ class DaemonConfig:
         """Create config from environment variables."""
         return cls(
             db_path=os.getenv("DAEMON_DB_PATH", cls.db_path),
+            serializer=os.getenv("DAEMON_SERIALIZER", cls.serializer),
             worker_threads=int(os.getenv("DAEMON_WORKERS", cls.worker_threads)),
             max_retries=int(os.getenv("DAEMON_MAX_RETRIES", cls.max_retries)),
             worker_sleep=float(os.getenv("DAEMON_WORKER_SLEEP", cls.worker_sleep)),
+            batch_size=int(os.getenv("DAEMON_BATCH_SIZE", cls.batch_size)),
+            worker_mode=os.getenv("DAEMON_WORKER_MODE", cls.worker_mode),
+            retry_base=float(os.getenv("DAEMON_RETRY_BASE", cls.retry_base)),
+            retry_cap=float(os.getenv("DAEMON_RETRY_CAP", cls.retry_cap)),
+            retry_jitter=os.getenv("DAEMON_RETRY_JITTER", cls.retry_jitter),
+            retention_seconds=float(
+                os.getenv("DAEMON_RETENTION_SECONDS", cls.retention_seconds)
+            ),
+            maintenance_interval=float(
+                os.getenv("DAEMON_MAINTENANCE_INTERVAL", cls.maintenance_interval)
+            ),
             host=os.getenv("DAEMON_HOST", cls.host),
             port=int(os.getenv("DAEMON_PORT", cls.port)),
             task_timeout=float(os.getenv("DAEMON_TASK_TIMEOUT", cls.task_timeout)),
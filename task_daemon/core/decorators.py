@@ -1,12 +1,107 @@
 """Task handler decorators."""
 
-from typing import Dict, Callable
+import inspect
+from typing import Dict, Callable, Optional
 from functools import wraps
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 # Registry for task handlers
 _task_handlers: Dict[str, Callable[[BaseModel], BaseModel]] = {}
 
+# Dispatch metadata per handler, computed once at registration so the
+# hot path never re-inspects signatures or re-derives Pydantic schemas.
+_handler_meta: Dict[Callable, "HandlerMeta"] = {}
+
+
+class HandlerMeta:
+    """Precomputed dispatch info for a task handler.
+
+    call_shape is one of "no_args", "model", "event" or "multi_arg";
+    dispatch branches on it directly instead of re-deriving the calling
+    convention from the signature per task.
+    """
+
+    __slots__ = (
+        "call_shape",
+        "param_count",
+        "param_names",
+        "input_adapter",
+        "output_adapter",
+        "is_async",
+        "validate_input",
+        "validate_input_json",
+        "serialize_output",
+    )
+
+    def __init__(
+        self,
+        call_shape: str,
+        param_count: int,
+        param_names: tuple,
+        input_adapter: Optional[TypeAdapter],
+        output_adapter: Optional[TypeAdapter],
+        is_async: bool = False,
+    ):
+        self.call_shape = call_shape
+        self.param_count = param_count
+        self.param_names = param_names
+        self.input_adapter = input_adapter
+        self.output_adapter = output_adapter
+        self.is_async = is_async
+        # Bound pydantic-core methods: calling the compiled
+        # SchemaValidator/SchemaSerializer directly skips the TypeAdapter
+        # wrapper frame on every dispatch.
+        if input_adapter is not None:
+            self.validate_input = input_adapter.validator.validate_python
+            self.validate_input_json = input_adapter.validator.validate_json
+        else:
+            self.validate_input = None
+            self.validate_input_json = None
+        self.serialize_output = (
+            output_adapter.serializer.to_python if output_adapter is not None else None
+        )
+
+
+def _build_meta(func: Callable) -> HandlerMeta:
+    """Inspect a handler once and cache its calling shape and adapters."""
+    sig = inspect.signature(func)
+    params = list(sig.parameters.values())
+
+    input_adapter = None
+    if len(params) == 1:
+        annotation = params[0].annotation
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            input_adapter = TypeAdapter(annotation)
+
+    output_adapter = None
+    returns = sig.return_annotation
+    if isinstance(returns, type) and issubclass(returns, BaseModel):
+        output_adapter = TypeAdapter(returns)
+
+    if not params:
+        call_shape = "no_args"
+    elif len(params) == 1:
+        call_shape = "model" if input_adapter is not None else "event"
+    else:
+        call_shape = "multi_arg"
+
+    return HandlerMeta(
+        call_shape,
+        len(params),
+        tuple(p.name for p in params),
+        input_adapter,
+        output_adapter,
+        inspect.iscoroutinefunction(func),
+    )
+
+
+def get_handler_meta(func: Callable) -> HandlerMeta:
+    """Get (or lazily build) the cached dispatch metadata for a handler."""
+    meta = _handler_meta.get(func)
+    if meta is None:
+        meta = _handler_meta[func] = _build_meta(func)
+    return meta
+
 
 def task_handler(
     func: Callable[[BaseModel], BaseModel],
@@ -23,6 +118,7 @@ def task_handler(
 
     task_type = func.__name__
     _task_handlers[task_type] = wrapper
+    get_handler_meta(wrapper)
     return wrapper
 
 
@@ -40,8 +136,10 @@ def register_handler(func: Callable) -> None:
     """Register a handler function using its name as task type."""
     task_type = func.__name__
     _task_handlers[task_type] = func
+    get_handler_meta(func)
 
 
 def clear_handlers():
     """Clear all registered handlers (for testing)."""
     _task_handlers.clear()
+    _handler_meta.clear()
@@ -1,116 +1,334 @@
 """In-memory task queue implementation."""
 
+import heapq
+import itertools
 import threading
 import time
-from typing import Optional, Tuple, Any, Dict, List
-from dataclasses import dataclass, field
-from datetime import datetime
+from collections import deque
+from typing import Callable, Optional, Tuple, Any, Dict, List
+from datetime import datetime, timezone
 
 from .queue import Queue
 
 
-@dataclass
+def _iso(ns: Optional[int]) -> Optional[str]:
+    """Format an epoch-nanosecond timestamp as ISO 8601 (UTC)."""
+    if ns is None:
+        return None
+    return datetime.fromtimestamp(ns / 1e9, tz=timezone.utc).isoformat()
+
+
+# Number of lock shards for task metadata. Spreads unrelated get_task /
+# mark_complete / delete_task calls across independent locks instead of
+# serializing every operation behind one queue-wide mutex.
+_SHARD_COUNT = 16
+
+
 class Task:
-    """Task data structure."""
+    """Task data structure.
 
-    id: int
-    task_type: str
-    task_data: Any
-    status: str = "pending"
-    created_at: datetime = field(default_factory=datetime.utcnow)
-    completed_at: Optional[datetime] = None
-    attempts: int = 0
-    last_error: Optional[str] = None
-    result: Any = None
+    A plain __slots__ class: without a per-instance __dict__ each task
+    costs a few machine words per field instead of ~280 bytes of dict
+    overhead, which matters when millions of tasks sit in memory.
+    (dataclass(slots=True) needs Python 3.10; this project supports 3.9.)
+    Timestamps are epoch nanoseconds — time.time_ns() is a single C call
+    and ISO rendering happens lazily in _task_to_dict.
+    """
+
+    __slots__ = (
+        "id",
+        "task_type",
+        "task_data",
+        "status",
+        "created_at",
+        "completed_at",
+        "attempts",
+        "last_error",
+        "result",
+        "available_at",
+        "priority",
+    )
+
+    def __init__(
+        self,
+        id: int,
+        task_type: str,
+        task_data: Any,
+        priority: int = 5,
+    ):
+        self.id = id
+        self.task_type = task_type
+        self.task_data = task_data
+        self.status = "pending"
+        self.created_at = time.time_ns()
+        self.completed_at: Optional[int] = None
+        self.attempts = 0
+        self.last_error: Optional[str] = None
+        self.result: Any = None
+        self.available_at = 0.0
+        self.priority = priority
 
 
 class MemoryQueue(Queue):
-    """Thread-safe in-memory task queue."""
-
-    def __init__(self):
-        self._lock = threading.Lock()
-        self._tasks: Dict[int, Task] = {}
-        self._next_id = 1
-
-    def enqueue(self, task_type: str, task_data: Any) -> int:
-        """Add task to queue. Returns task ID."""
-        with self._lock:
-            task_id = self._next_id
-            self._next_id += 1
-            self._tasks[task_id] = Task(
-                id=task_id, task_type=task_type, task_data=task_data
-            )
-            return task_id
+    """Thread-safe in-memory task queue.
+
+    Task metadata lives in ``_SHARD_COUNT`` dicts sharded by id, each
+    behind its own lock, so operations on unrelated tasks don't contend.
+    Only the pending heap keeps a queue-wide lock (its Condition also
+    backs wait_for_task). Lock order is heap -> shard; writers touching
+    both (mark_failed, redrive) release the shard lock before taking the
+    heap lock, so the order is never inverted.
+    """
+
+    def __init__(self, max_completed: int = 0):
+        # When max_completed > 0, only that many completed tasks are
+        # retained; the oldest are evicted so a long-running process
+        # doesn't grow without bound. 0 keeps everything.
+        self._max_completed = max_completed
+        self._completed_ids: deque = deque()
+        self._completed_lock = threading.Lock()
+        self._shards: List[Dict[int, Task]] = [{} for _ in range(_SHARD_COUNT)]
+        self._shard_locks = [threading.Lock() for _ in range(_SHARD_COUNT)]
+        # Guards the pending heap and its sidecar counter.
+        self._heap_lock = threading.Lock()
+        # Signalled whenever a task becomes pending, so idle workers in
+        # wait_for_task wake immediately instead of sleeping out a poll
+        # interval.
+        self._not_empty = threading.Condition(self._heap_lock)
+        # itertools.count.__next__ is a single C call, atomic under the
+        # GIL; no lock needed for ID allocation.
+        self._next_id = itertools.count(1)
+        # Heap of (priority, task_id) so dequeue pops the highest-
+        # priority (lowest number) pending task in O(log n), FIFO
+        # within a priority level.
+        self._pending: List[Tuple[int, int]] = []
+        # Backed-off retries parked as (available_at, priority, task_id)
+        # until they mature. Kept off the pending heap so wait_for_task
+        # can tell claimable work from tasks still inside their backoff
+        # window — otherwise an idle worker would wake, fail to dequeue,
+        # and spin for the whole window.
+        self._deferred: List[Tuple[float, int, int]] = []
+        # Sidecar counter so size() is O(1) instead of rescanning every
+        # task; updated on each pending<->other status transition and
+        # counting backed-off tasks (they are still pending).
+        self._pending_count = 0
+
+    def _shard(self, task_id: int) -> Tuple[Dict[int, Task], threading.Lock]:
+        index = task_id % _SHARD_COUNT
+        return self._shards[index], self._shard_locks[index]
+
+    def enqueue(self, task_type: str, task_data: Any, priority: int = 5) -> int:
+        """Add task to queue. Returns task ID. Lower priority runs first."""
+        task_id = next(self._next_id)
+        task = Task(
+            id=task_id, task_type=task_type, task_data=task_data, priority=priority
+        )
+        shard, lock = self._shard(task_id)
+        with lock:
+            shard[task_id] = task
+        with self._not_empty:
+            heapq.heappush(self._pending, (priority, task_id))
+            self._pending_count += 1
+            self._not_empty.notify()
+        return task_id
 
     def dequeue(self) -> Optional[Tuple[int, str, Any]]:
         """Get next pending task. Returns (id, task_type, task_data) or None."""
-        with self._lock:
-            for task in self._tasks.values():
-                if task.status == "pending":
-                    task.status = "processing"
-                    return task.id, task.task_type, task.task_data
-            return None
+        with self._heap_lock:
+            return self._claim_next(time.time())
+
+    def dequeue_batch(self, limit: int) -> List[Tuple[int, str, Any]]:
+        """Claim up to ``limit`` pending tasks under one lock acquisition."""
+        with self._heap_lock:
+            now = time.time()
+            tasks = []
+            for _ in range(limit):
+                task = self._claim_next(now)
+                if task is None:
+                    break
+                tasks.append(task)
+            return tasks
+
+    def _promote_deferred(self, now: float):
+        """Move matured backed-off entries onto the pending heap.
+
+        Caller holds the heap lock. Entries whose task was deleted or
+        transitioned meanwhile are harmless: _claim_next skips them.
+        """
+        while self._deferred and self._deferred[0][0] <= now:
+            _, priority, task_id = heapq.heappop(self._deferred)
+            heapq.heappush(self._pending, (priority, task_id))
+
+    def _claim_next(self, now: float) -> Optional[Tuple[int, str, Any]]:
+        """Pop the next runnable pending task. Caller holds the heap lock."""
+        self._promote_deferred(now)
+        while self._pending:
+            priority, task_id = heapq.heappop(self._pending)
+            shard, lock = self._shard(task_id)
+            with lock:
+                task = shard.get(task_id)
+                # Skip IDs whose task was deleted or already transitioned
+                if not task or task.status != "pending":
+                    continue
+                if task.available_at > now:
+                    # Still backing off; park it until it matures
+                    heapq.heappush(
+                        self._deferred, (task.available_at, priority, task_id)
+                    )
+                    continue
+                task.status = "processing"
+                self._pending_count -= 1
+                return task.id, task.task_type, task.task_data
+        return None
 
     def mark_complete(self, task_id: int, result: Any = None):
         """Mark task as completed (terminal state)."""
-        with self._lock:
-            if task_id in self._tasks:
-                task = self._tasks[task_id]
-                task.status = "completed"
-                task.completed_at = datetime.utcnow()
-                task.result = result
-
-    def mark_failed(self, task_id: int, error: str, max_retries: int = 3):
-        """Mark task as failed, retry if under max attempts."""
-        with self._lock:
-            if task_id not in self._tasks:
+        shard, lock = self._shard(task_id)
+        with lock:
+            task = shard.get(task_id)
+            if task is None:
+                return
+            task.status = "completed"
+            task.completed_at = time.time_ns()
+            task.result = result
+        if self._max_completed:
+            self._evict_completed(task_id)
+
+    def _evict_completed(self, task_id: int):
+        """Drop the oldest completed tasks beyond the retention cap."""
+        evict = []
+        with self._completed_lock:
+            self._completed_ids.append(task_id)
+            while len(self._completed_ids) > self._max_completed:
+                evict.append(self._completed_ids.popleft())
+        for old_id in evict:
+            shard, lock = self._shard(old_id)
+            with lock:
+                task = shard.get(old_id)
+                # Only evict if still completed; a deleted slot or an id
+                # reused by redrive stays untouched.
+                if task is not None and task.status == "completed":
+                    del shard[old_id]
+
+    def mark_failed(
+        self,
+        task_id: int,
+        error: str,
+        max_retries: int = 3,
+        backoff: Optional[Callable[[int], float]] = None,
+    ):
+        """Mark task as failed, retry if under max attempts.
+
+        If ``backoff`` is given the retried task only becomes visible to
+        dequeue after the computed delay, avoiding retry storms.
+        """
+        shard, lock = self._shard(task_id)
+        with lock:
+            task = shard.get(task_id)
+            if task is None:
                 return
 
-            task = self._tasks[task_id]
             task.attempts += 1
             task.last_error = error
 
             if task.attempts >= max_retries:
                 task.status = "failed"
+                return
+            task.status = "pending"
+            if backoff:
+                task.available_at = time.time() + backoff(task.attempts)
+            priority = task.priority
+            available_at = task.available_at
+        # Shard lock released before taking the heap lock (lock order).
+        with self._not_empty:
+            if available_at > time.time():
+                # Straight to the deferred heap so waiters never see the
+                # retry as claimable; the notify still wakes them to
+                # re-cap their wait at the new maturity.
+                heapq.heappush(self._deferred, (available_at, priority, task_id))
             else:
-                task.status = "pending"
+                heapq.heappush(self._pending, (priority, task_id))
+            self._pending_count += 1
+            self._not_empty.notify()
+
+    def wait_for_task(self, timeout: float) -> bool:
+        """Wait for a claimable task, waking as soon as one is enqueued.
+
+        Tasks inside a retry-backoff window don't count as ready work —
+        reporting them would make the worker loop spin on dequeue for
+        the whole window. When only backed-off tasks remain, the wait is
+        capped at the earliest maturity so the retry isn't left sitting
+        past its deadline.
+        """
+        with self._not_empty:
+            now = time.time()
+            self._promote_deferred(now)
+            if self._pending_count > len(self._deferred):
+                return True
+            if self._deferred:
+                timeout = min(timeout, self._deferred[0][0] - now)
+            return self._not_empty.wait(timeout)
 
     def size(self) -> int:
         """Get number of pending tasks."""
-        with self._lock:
-            return sum(1 for task in self._tasks.values() if task.status == "pending")
+        with self._heap_lock:
+            return self._pending_count
 
     def get_recent_tasks(self, limit: int = 20) -> List[Dict[str, Any]]:
         """Get recent tasks for monitoring."""
-        with self._lock:
-            tasks = sorted(self._tasks.values(), key=lambda t: t.id, reverse=True)[
-                :limit
-            ]
-            return [self._task_to_dict(task) for task in tasks]
+        recent: List[Task] = []
+        for shard, lock in zip(self._shards, self._shard_locks):
+            # One shard lock at a time; the snapshot is only advisory.
+            with lock:
+                recent.extend(heapq.nlargest(limit, shard.values(), key=lambda t: t.id))
+        recent = heapq.nlargest(limit, recent, key=lambda t: t.id)
+        return [self._task_to_dict(task) for task in recent]
 
     def get_task(self, task_id: int) -> Optional[Dict[str, Any]]:
         """Get task by ID with all metadata."""
-        with self._lock:
-            task = self._tasks.get(task_id)
+        shard, lock = self._shard(task_id)
+        with lock:
+            task = shard.get(task_id)
             return self._task_to_dict(task) if task else None
 
+    def get_tasks_by_ids(self, task_ids: List[int]) -> List[Dict[str, Any]]:
+        """Fetch several tasks by ID, locking each shard once per hit."""
+        tasks = []
+        for task_id in task_ids:
+            shard, lock = self._shard(task_id)
+            with lock:
+                task = shard.get(task_id)
+                if task is not None:
+                    tasks.append(self._task_to_dict(task))
+        return tasks
+
     def delete_task(self, task_id: int) -> bool:
         """Delete task from queue. Returns True if task existed."""
-        with self._lock:
-            if task_id in self._tasks:
-                del self._tasks[task_id]
-                return True
+        shard, lock = self._shard(task_id)
+        with lock:
+            task = shard.pop(task_id, None)
+        if task is None:
             return False
+        if task.status == "pending":
+            with self._heap_lock:
+                self._pending_count -= 1
+        return True
 
     def redrive_task(self, task_id: int) -> bool:
         """Redrive a failed task by resetting it to pending. Returns True if successful."""
-        with self._lock:
-            task = self._tasks.get(task_id)
-            if task and task.status == "failed":
-                task.status = "pending"
-                task.last_error = None
-                return True
-            return False
+        shard, lock = self._shard(task_id)
+        with lock:
+            task = shard.get(task_id)
+            if not task or task.status != "failed":
+                return False
+            task.status = "pending"
+            task.last_error = None
+            priority = task.priority
+        with self._not_empty:
+            heapq.heappush(self._pending, (priority, task_id))
+            self._pending_count += 1
+            self._not_empty.notify()
+        return True
 
     def _task_to_dict(self, task: Task) -> Dict[str, Any]:
         """Convert task to dictionary."""
@@ -119,10 +337,8 @@ class MemoryQueue(Queue):
             "task_type": task.task_type,
             "task_data": task.task_data,
             "status": task.status,
-            "created_at": task.created_at.isoformat() if task.created_at else None,
-            "completed_at": (
-                task.completed_at.isoformat() if task.completed_at else None
-            ),
+            "created_at": _iso(task.created_at),
+            "completed_at": _iso(task.completed_at),
             "attempts": task.attempts,
             "last_error": task.last_error,
             "result": task.result,
@@ -1,5 +1,7 @@
 """Unified metrics interface for Task Daemon."""
 
+import threading
+import time
 from prometheus_client import (
     Counter,
     Gauge,
@@ -9,12 +11,49 @@ from prometheus_client import (
 )
 from typing import Dict, Any
 
+# How long a serialized /metrics payload may be served from cache.
+_SCRAPE_TTL = 0.5
+
+
+class LocalMetrics:
+    """Plain-Python accumulator of task outcomes.
+
+    Workers record into these bare ints/lists instead of touching the
+    Prometheus objects (label lookup, per-metric lock, histogram bucket
+    walk) on every task; a reporter thread flushes the aggregate.
+    """
+
+    __slots__ = ("success", "failed", "durations")
+
+    def __init__(self):
+        self.success = 0
+        self.failed = 0
+        self.durations = []
+
 
 class MetricsCollector:
     """Unified metrics collection and access."""
 
     def __init__(self, registry=None):
         self.registry = registry or CollectorRegistry()
+        # Ping-pong buffer: flush() swaps in a fresh accumulator under
+        # the lock and applies the old one to Prometheus outside it.
+        self._buf = LocalMetrics()
+        self._buf_lock = threading.Lock()
+        self._reporting = False
+        self._reporter = None
+        # Plain-int mirrors of the exported values so get_summary never
+        # reaches into prometheus_client internals (_value._value) or
+        # takes its per-metric locks.
+        self._received_total = 0
+        self._success_total = 0
+        self._failed_total = 0
+        self._queue_size_value = 0
+        self._healthy = False
+        # Serialized /metrics text, regenerated at most once per
+        # _SCRAPE_TTL so scrape storms don't re-walk every collector.
+        self._scrape_bytes = b""
+        self._scrape_ts = 0.0
         self.tasks_received = Counter(
             "tasks_received_total", "Total tasks received", registry=self.registry
         )
@@ -35,39 +74,126 @@ class MetricsCollector:
             "Daemon health status (1=healthy, 0=unhealthy)",
             registry=self.registry,
         )
+        # Pre-bound label children: .labels() hashes and resolves the
+        # label dict on every call, so bind the two permutations once.
+        self._success_counter = self.tasks_processed.labels(status="success")
+        self._failed_counter = self.tasks_processed.labels(status="failed")
 
     def task_received(self):
         """Record a task being received."""
         self.tasks_received.inc()
+        self._received_total += 1
 
     def task_processed(self, status: str, duration: float = None):
         """Record a task being processed."""
-        self.tasks_processed.labels(status=status).inc()
+        if status == "success":
+            self._success_counter.inc()
+            self._success_total += 1
+        else:
+            self._failed_counter.inc()
+            self._failed_total += 1
         if duration is not None:
             self.processing_time.observe(duration)
 
+    def task_processed_local(self, status: str, duration: float = None):
+        """Buffer a task outcome for the reporter thread to flush.
+
+        Hot-path counterpart of task_processed: a couple of int ops
+        under a short lock instead of Prometheus label resolution and
+        histogram observation per task.
+        """
+        with self._buf_lock:
+            buf = self._buf
+            if status == "success":
+                buf.success += 1
+            else:
+                buf.failed += 1
+            if duration is not None:
+                buf.durations.append(duration)
+
+    def flush(self):
+        """Apply buffered task outcomes to the Prometheus metrics."""
+        with self._buf_lock:
+            buf, self._buf = self._buf, LocalMetrics()
+        if buf.success:
+            self._success_counter.inc(buf.success)
+            self._success_total += buf.success
+        if buf.failed:
+            self._failed_counter.inc(buf.failed)
+            self._failed_total += buf.failed
+        for duration in buf.durations:
+            self.processing_time.observe(duration)
+
+    def start_reporter(self, queue=None, interval: float = 1.0):
+        """Start the background thread that flushes buffered outcomes.
+
+        When ``queue`` is given the reporter also refreshes the queue
+        size gauge once per interval, replacing the per-task size()
+        query the workers used to issue.
+        """
+        if self._reporter is not None:
+            return
+        self._reporting = True
+
+        def loop():
+            while self._reporting:
+                try:
+                    self.flush()
+                    if queue is not None:
+                        self.update_queue_size(queue.size())
+                except Exception:  # pragma: no cover - keep reporting alive
+                    pass
+                time.sleep(interval)
+
+        self._reporter = threading.Thread(target=loop, daemon=True)
+        self._reporter.start()
+
+    def stop_reporter(self):
+        """Stop the reporter thread and flush whatever is buffered."""
+        self._reporting = False
+        self._reporter = None
+        self.flush()
+
     def update_queue_size(self, size: int):
         """Update current queue size."""
         self.queue_size.set(size)
+        self._queue_size_value = size
+
+    def queue_size_value(self) -> int:
+        """Last reported queue size (atomic int read, no SQL).
+
+        Refreshed once per interval by the reporter thread; health
+        probes and gRPC status calls read this instead of issuing a
+        COUNT(*) per request.
+        """
+        return self._queue_size_value
 
     def set_health(self, healthy: bool):
         """Set daemon health status."""
         self.daemon_health.set(1 if healthy else 0)
+        self._healthy = healthy
+
+    def get_prometheus_metrics(self) -> bytes:
+        """Get Prometheus formatted metrics.
 
-    def get_prometheus_metrics(self) -> str:
-        """Get Prometheus formatted metrics."""
-        return generate_latest(self.registry)
+        The serialized text is cached for _SCRAPE_TTL: generate_latest
+        walks and formats every collector, so back-to-back scrapes reuse
+        the same bytes instead of repeating that work.
+        """
+        now = time.monotonic()
+        if now - self._scrape_ts >= _SCRAPE_TTL:
+            self.flush()
+            self._scrape_bytes = generate_latest(self.registry)
+            self._scrape_ts = now
+        return self._scrape_bytes
 
     def get_summary(self) -> Dict[str, Any]:
         """Get metrics summary as dict."""
+        self.flush()
         return {
-            "tasks_received": self.tasks_received._value._value,
-            "tasks_processed_success": self.tasks_processed.labels(
-                status="success"
-            )._value._value,
-            "tasks_processed_failed": self.tasks_processed.labels(
-                status="failed"
-            )._value._value,
-            "queue_size": self.queue_size._value._value,
-            "daemon_healthy": bool(self.daemon_health._value._value),
+            "tasks_received": self._received_total,
+            "tasks_processed_success": self._success_total,
+            "tasks_processed_failed": self._failed_total,
+            "queue_size": self._queue_size_value,
+            "daemon_healthy": self._healthy,
         }
@@ -1,15 +1,16 @@
 """Queue interface for TaskDaemon."""
 
+import time
 from abc import ABC, abstractmethod
-from typing import Optional, Tuple, Any, Dict, List
+from typing import Callable, Optional, Tuple, Any, Dict, List
 
 
 class Queue(ABC):
     """Abstract interface for task queues."""
 
     @abstractmethod
-    def enqueue(self, task_type: str, task_data: Any) -> int:
-        """Add task to queue. Returns task ID."""
+    def enqueue(self, task_type: str, task_data: Any, priority: int = 5) -> int:
+        """Add task to queue. Returns task ID. Lower priority runs first."""
         pass
 
     @abstractmethod
@@ -23,10 +24,44 @@ class Queue(ABC):
         pass
 
     @abstractmethod
-    def mark_failed(self, task_id: int, error: str, max_retries: int = 3):
-        """Mark task as failed, retry if under max attempts."""
+    def mark_failed(
+        self,
+        task_id: int,
+        error: str,
+        max_retries: int = 3,
+        backoff: Optional[Callable[[int], float]] = None,
+    ):
+        """Mark task as failed, retry if under max attempts.
+
+        If ``backoff`` is given it maps the next attempt number to a delay
+        in seconds; the task stays invisible to dequeue until it elapses.
+        """
         pass
 
+    def dequeue_batch(self, limit: int) -> List[Tuple[int, str, Any]]:
+        """Claim up to ``limit`` pending tasks in one call.
+
+        Backends override this with a single batched claim; the default
+        falls back to repeated dequeue calls.
+        """
+        tasks = []
+        for _ in range(limit):
+            task = self.dequeue()
+            if task is None:
+                break
+            tasks.append(task)
+        return tasks
+
+    def wait_for_task(self, timeout: float) -> bool:
+        """Block until a task may be available or ``timeout`` elapses.
+
+        In-process backends override this to wake waiters the moment a
+        task is enqueued; the default is a plain sleep, so poll-based
+        backends keep the same worker loop.
+        """
+        time.sleep(timeout)
+        return False
+
     @abstractmethod
     def size(self) -> int:
         """Get number of pending tasks."""
@@ -42,6 +77,19 @@ class Queue(ABC):
         """Get task by ID with all metadata."""
         pass
 
+    def get_tasks_by_ids(self, task_ids: List[int]) -> List[Dict[str, Any]]:
+        """Fetch several tasks by ID in one call.
+
+        Backends override this with a single batched lookup; the default
+        falls back to per-ID get_task calls.
+        """
+        tasks = []
+        for task_id in task_ids:
+            task = self.get_task(task_id)
+            if task:
+                tasks.append(task)
+        return tasks
+
     @abstractmethod
     def delete_task(self, task_id: int) -> bool:
         """Delete task from queue. Returns True if task existed."""
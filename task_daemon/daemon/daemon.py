@@ -1,21 +1,79 @@
 """Main TaskDaemon implementation."""
 
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import PlainTextResponse, Response
+from fastapi.responses import FileResponse, PlainTextResponse, Response
+import asyncio
+import queue as _queue
+import random
 import threading
+from collections import deque
 import time
 import logging
+import logging.handlers
 import uvicorn
+import json
 from datetime import datetime
 from typing import Optional, Dict, Any, List
 from pydantic import BaseModel
 
+try:
+    import orjson
+
+    _loads = orjson.loads
+    _dump_bytes = orjson.dumps
+except ImportError:  # pragma: no cover - orjson is a regular dependency
+    _loads = json.loads
+
+    def _dump_bytes(obj):
+        return json.dumps(obj).encode("utf-8")
+
+
+# How long a formatted health timestamp may be reused. 100 ms of slack
+# is irrelevant for a probe timestamp.
+_NOW_TTL = 0.1
+_now_iso = ""
+_now_iso_ts = 0.0
+
+
+def _utcnow_iso() -> str:
+    """ISO timestamp for health responses, cached for _NOW_TTL.
+
+    datetime construction plus isoformat is pure Python string work;
+    at probe frequencies reusing the formatted string for 100 ms saves
+    it entirely. Unlocked on purpose: a rare double format is harmless.
+    """
+    global _now_iso, _now_iso_ts
+    now = time.monotonic()
+    if now - _now_iso_ts >= _NOW_TTL:
+        _now_iso = datetime.utcnow().isoformat()
+        _now_iso_ts = now
+    return _now_iso
+
+
+# Invariant shell of the /health body; only three fields change per
+# probe, so bytes %-formatting replaces dict construction + JSON encode.
+_HEALTH_TMPL = b'{"status":"healthy","queue_size":%d,"timestamp":"%s","workers":%d}'
+
+
+def _json_response(content, headers=None) -> Response:
+    """JSON response serialized with orjson's C encoder.
+
+    Bypasses the stdlib-json default response path on the hot read
+    endpoints, where payload size makes encoding cost visible.
+    """
+    return Response(
+        content=_dump_bytes(content),
+        media_type="application/json",
+        headers=headers,
+    )
+
+
 from ..config import DaemonConfig
 from ..core.persistent_queue import PersistentQueue
 from ..core.queue import Queue
 from ..protocols import get_protocol
 from ..core.metrics import MetricsCollector
-from ..core.decorators import get_task_handler, register_handler
+from ..core.decorators import get_task_handler, get_handler_meta, register_handler
 
 
 class TaskRequest(BaseModel):
@@ -50,46 +108,160 @@ class TaskDaemon:
         queue: Optional[Queue] = None,
     ):
         self.config = config or DaemonConfig()
-        self.queue = queue or PersistentQueue(self.config.db_path)
+        self.queue = queue or PersistentQueue(
+            self.config.db_path, serializer=self.config.serializer
+        )
         self.metrics = MetricsCollector(metrics_registry)
+        # Raw dequeue hands back stored JSON text so model handlers can
+        # validate it in a single pass; only queues storing JSON text
+        # advertise it (raw_json is False under the msgpack serializer).
+        self._use_raw = getattr(self.queue, "raw_json", False)
+        # task_type -> compiled dispatch closure; built at registration
+        # (or lazily for decorator-registered handlers) so the worker
+        # loop is one dict lookup plus one call per task.
+        self._dispatch: Dict[str, Any] = {}
         self.app = FastAPI(title="TaskDaemon", version="0.1.0")
         self._setup_logging()
         self._setup_routes()
         self._workers = []
         self._running = False
+        # Notified whenever a task reaches a terminal state, so watchers
+        # can wake immediately instead of polling.
+        self._task_event = threading.Condition()
+        # Jittered retry backoff; tests may swap in random.Random(seed)
+        # for deterministic delays.
+        self._retry_rng = random.Random()
+        # Monotonic version bumped on every mutation; backs the ETag on
+        # task listings so unchanged polls short-circuit with a 304.
+        self._state_version = 0
 
     def _setup_logging(self):
-        """Configure logging."""
-        logging.basicConfig(
-            level=getattr(logging, self.config.log_level),
-            format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        )
+        """Configure logging.
+
+        Log records are handed off to a background QueueListener so
+        worker threads never block on stdout writes; they only pay for
+        an enqueue onto a SimpleQueue.
+        """
+        root = logging.getLogger()
+        root.setLevel(getattr(logging, self.config.log_level))
+        if not any(isinstance(h, logging.handlers.QueueHandler) for h in root.handlers):
+            stream = logging.StreamHandler()
+            stream.setFormatter(
+                logging.Formatter(
+                    "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+                )
+            )
+            log_queue: _queue.SimpleQueue = _queue.SimpleQueue()
+            self._log_listener = logging.handlers.QueueListener(
+                log_queue, stream, respect_handler_level=True
+            )
+            self._log_listener.start()
+            root.addHandler(logging.handlers.QueueHandler(log_queue))
         self.logger = logging.getLogger(__name__)
 
-    def _invoke_handler(self, handler, task_data):
-        """Invoke handler with proper type conversion for input and output."""
-        import inspect
-        from pydantic import BaseModel
+    def _retry_delay(self, attempt: int) -> float:
+        """Backoff delay in seconds before a task's next retry attempt.
+
+        Jitter spreads retries out so workers don't all wake at the same
+        t=2,4,8s boundaries during a partial outage.
+        """
+        delay = min(self.config.retry_cap, self.config.retry_base * (2**attempt))
+        if self.config.retry_jitter == "full":
+            return self._retry_rng.uniform(0, delay)
+        if self.config.retry_jitter == "equal":
+            return delay / 2 + self._retry_rng.uniform(0, delay / 2)
+        return delay
+
+    def _bump_state(self):
+        """Record a queue mutation so cached task listings invalidate."""
+        with self._task_event:
+            self._state_version += 1
+
+    def _compile_handler(self, handler, raw):
+        """Build a dispatch closure specialized for one handler.
+
+        All the per-shape branching in _invoke_handler (and the raw vs
+        decoded input distinction) is resolved here, once, so the worker
+        loop pays for a single call per task instead of re-walking the
+        dispatch tree.
+        """
+        meta = get_handler_meta(handler)
+        serialize = meta.serialize_output
+
+        def finish(result):
+            if isinstance(result, BaseModel):
+                return (
+                    serialize(result) if serialize is not None else result.model_dump()
+                )
+            return result
+
+        if meta.call_shape == "no_args":
+
+            def run(task_data):
+                return finish(handler())
+
+        elif meta.call_shape == "model":
+            validate = meta.validate_input_json if raw else meta.validate_input
+
+            def run(task_data):
+                if task_data is not None:
+                    return finish(handler(validate(task_data)))
+                return finish(handler(task_data))
+
+        elif meta.call_shape == "event":
+            if raw:
+
+                def run(task_data):
+                    return finish(
+                        handler(_loads(task_data) if task_data is not None else None)
+                    )
+
+            else:
+
+                def run(task_data):
+                    return finish(handler(task_data))
+
+        else:
 
-        sig = inspect.signature(handler)
-        params = list(sig.parameters.values())
+            def run(task_data):
+                if raw and task_data is not None:
+                    task_data = _loads(task_data)
+                if isinstance(task_data, dict):
+                    if "args" in task_data and len(task_data) == 1:
+                        return finish(handler(*task_data["args"]))
+                    return finish(handler(**task_data))
+                return finish(handler(task_data))
+
+        return run
+
+    def _invoke_handler(self, handler, task_data, raw=False):
+        """Invoke handler with proper type conversion for input and output.
+
+        With raw=True, task_data is the stored JSON text: model handlers
+        validate it in one pass (validate_json) with no intermediate
+        dict; other shapes decode it first.
+        """
+        # Dispatch metadata (call shape + validation adapters) is computed
+        # once at registration, so no signature inspection happens per task.
+        meta = get_handler_meta(handler)
+
+        if raw and task_data is not None:
+            if meta.call_shape == "model":
+                task_data = meta.validate_input_json(task_data)
+            else:
+                task_data = _loads(task_data)
 
-        # No parameters - call with no args
-        if not params:
+        if meta.call_shape == "no_args":
             result = handler()
-        # Single parameter - existing behavior
-        elif len(params) == 1:
-            if task_data is not None:
-                expected_type = params[0].annotation
-                if expected_type != inspect.Parameter.empty and hasattr(
-                    expected_type, "model_validate"
-                ):
-                    task_input = expected_type.model_validate(task_data)
-                    result = handler(task_input)
-                else:
-                    result = handler(task_data)
+        elif meta.call_shape == "model":
+            if isinstance(task_data, BaseModel):
+                result = handler(task_data)
+            elif task_data is not None:
+                result = handler(meta.validate_input(task_data))
             else:
                 result = handler(task_data)
+        elif meta.call_shape == "event":
+            result = handler(task_data)
         # Multiple parameters
         else:
             if isinstance(task_data, dict):
@@ -104,22 +276,30 @@ class TaskDaemon:
 
         # Handle output serialization
         if isinstance(result, BaseModel):
-            serialized = result.model_dump()
-            self.logger.debug(f"Serialized Pydantic result: {serialized}")
+            serialized = (
+                meta.serialize_output(result)
+                if meta.serialize_output is not None
+                else result.model_dump()
+            )
+            self.logger.debug("Serialized Pydantic result: %s", serialized)
             return serialized
         return result
 
     def _setup_routes(self):
         """Setup FastAPI routes."""
 
-        @self.app.get("/health", response_model=HealthResponse)
+        @self.app.get("/health")
         async def health():
-            return HealthResponse(
-                status="healthy",
-                queue_size=self.queue.size(),
-                timestamp=datetime.utcnow().isoformat(),
-                workers=len(self._workers),
+            # Formatted straight into the static template: no dict, no
+            # JSON encoder, and the queue size is the cached value the
+            # reporter thread refreshes — a COUNT(*) per probe is
+            # wasted at load-balancer frequencies.
+            body = _HEALTH_TMPL % (
+                self.metrics.queue_size_value(),
+                _utcnow_iso().encode("ascii"),
+                len(self._workers),
             )
+            return Response(content=body, media_type="application/json")
 
         @self.app.get("/metrics", response_class=PlainTextResponse)
         async def metrics():
@@ -127,7 +307,7 @@ class TaskDaemon:
 
         @self.app.get("/api/metrics")
         async def api_metrics():
-            return self.metrics.get_summary()
+            return _json_response(self.metrics.get_summary())
 
         @self.app.post("/queue", status_code=200)
         async def enqueue(request: Request):
@@ -147,10 +327,11 @@ class TaskDaemon:
                 if not task_type:
                     raise HTTPException(status_code=400, detail="Missing task type")
 
-                task_id = self.queue.enqueue(task_type, task_data)
+                priority = self.config.priority_map.get(task_type, 5)
+                task_id = self.queue.enqueue(task_type, task_data, priority=priority)
+                self._bump_state()
                 self.metrics.task_received()
-                self.metrics.update_queue_size(self.queue.size())
-                self.logger.info(f"Task {task_id} queued: {task_type}")
+                self.logger.info("Task %s queued: %s", task_id, task_type)
 
                 # Serialize response with same protocol
                 response_data = {"task_id": task_id}
@@ -160,33 +341,153 @@ class TaskDaemon:
             except HTTPException:
                 raise
             except Exception as e:
-                self.logger.error(f"Error enqueueing: {e}")
+                self.logger.error("Error enqueueing: %s", e)
+                raise HTTPException(status_code=500, detail=str(e))
+
+        @self.app.post("/queue/batch", status_code=200)
+        async def enqueue_batch(request: Request):
+            try:
+                content_type = request.headers.get("content-type", "application/json")
+                protocol = get_protocol(content_type)
+
+                body = await request.body()
+                data = protocol.deserialize(body)
+
+                items = []
+                for entry in data.get("tasks") or []:
+                    task_type = entry.get("type")
+                    if not task_type:
+                        raise HTTPException(status_code=400, detail="Missing task type")
+                    items.append(
+                        (
+                            task_type,
+                            entry.get("data") or {},
+                            self.config.priority_map.get(task_type, 5),
+                        )
+                    )
+
+                if not items:
+                    raise HTTPException(status_code=400, detail="No tasks provided")
+
+                # Single transaction for the whole batch where supported
+                if hasattr(self.queue, "enqueue_batch"):
+                    task_ids = self.queue.enqueue_batch(items)
+                else:
+                    task_ids = [
+                        self.queue.enqueue(task_type, task_data, priority=priority)
+                        for task_type, task_data, priority in items
+                    ]
+
+                self._bump_state()
+                for _ in task_ids:
+                    self.metrics.task_received()
+                self.logger.info("Queued batch of %d tasks", len(task_ids))
+
+                response_body = protocol.serialize({"task_ids": task_ids})
+                return Response(content=response_body, media_type=protocol.content_type)
+            except HTTPException:
+                raise
+            except Exception as e:
+                self.logger.error("Error enqueueing batch: %s", e)
                 raise HTTPException(status_code=500, detail=str(e))
 
         @self.app.get("/api/tasks")
-        async def get_tasks(limit: int = 20) -> List[Dict[str, Any]]:
+        async def get_tasks(request: Request, limit: int = 20):
             try:
-                return self.queue.get_recent_tasks(limit)
+                # One integer compare replaces the SQLite read + JSON
+                # encode when nothing has changed since the last poll.
+                etag = f'"{self._state_version}-{limit}"'
+                if request.headers.get("if-none-match") == etag:
+                    return Response(status_code=304, headers={"ETag": etag})
+                tasks = self.queue.get_recent_tasks(limit)
+                return _json_response(tasks, headers={"ETag": etag})
             except Exception as e:
                 raise HTTPException(status_code=500, detail=str(e))
 
+        @self.app.post("/api/tasks/batch")
+        async def get_tasks_batch(request: Request):
+            # One round-trip replaces N get_task polls for status sweeps.
+            try:
+                data = await request.json()
+                ids = data.get("ids")
+                if not isinstance(ids, list):
+                    raise HTTPException(status_code=400, detail="Missing ids list")
+                return _json_response(self.queue.get_tasks_by_ids(ids))
+            except HTTPException:
+                raise
+            except Exception as e:
+                raise HTTPException(status_code=500, detail=str(e))
+
+        @self.app.get("/api/tasks/{task_id}/wait")
+        def wait_task(task_id: int, timeout: float = 30.0):
+            # Long-poll: block until the task reaches a terminal state or
+            # the timeout elapses, then return its current state. Runs in
+            # the threadpool (sync route) so the event loop stays free.
+            deadline = time.time() + min(timeout, 60.0)
+            while True:
+                task = self.queue.get_task(task_id)
+                if not task:
+                    raise HTTPException(status_code=404, detail="Task not found")
+                if task["status"] in ("completed", "failed"):
+                    return _json_response(task)
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    return _json_response(task)
+                with self._task_event:
+                    self._task_event.wait(min(remaining, 1.0))
+
         @self.app.get("/api/tasks/{task_id}")
         async def get_task(task_id: int):
             try:
                 task = self.queue.get_task(task_id)
                 if task:
-                    return task
+                    return _json_response(task)
                 raise HTTPException(status_code=404, detail="Task not found")
             except HTTPException:
                 raise
             except Exception as e:
                 raise HTTPException(status_code=500, detail=str(e))
 
+        @self.app.get("/api/tasks/{task_id}/result")
+        async def get_task_result(task_id: int):
+            """Serve just the result, streaming file-backed payloads.
+
+            Handlers producing large outputs can return
+            ``{"__file__": path}``; the bytes are then spliced from the
+            page cache by FileResponse instead of being materialized as
+            a JSON string. Inline JSON results pass through as stored,
+            with no parse/re-encode.
+            """
+            try:
+                task = self.queue.get_task(task_id)
+                if not task:
+                    raise HTTPException(status_code=404, detail="Task not found")
+                result = task.get("result")
+                if isinstance(result, str):
+                    # Stored JSON text; peek at the prefix so large
+                    # payloads are never parsed just to detect the
+                    # file convention.
+                    if result.startswith('{"__file__"'):
+                        return FileResponse(
+                            _loads(result)["__file__"],
+                            media_type="application/octet-stream",
+                        )
+                    return Response(content=result, media_type="application/json")
+                if isinstance(result, dict) and "__file__" in result:
+                    return FileResponse(
+                        result["__file__"], media_type="application/octet-stream"
+                    )
+                return _json_response(result)
+            except HTTPException:
+                raise
+            except Exception as e:
+                raise HTTPException(status_code=500, detail=str(e))
+
         @self.app.delete("/api/tasks/{task_id}")
         async def delete_task(task_id: int):
             try:
                 if self.queue.delete_task(task_id):
-                    self.metrics.update_queue_size(self.queue.size())
+                    self._bump_state()
                     return {"message": "Task deleted"}
                 raise HTTPException(status_code=404, detail="Task not found")
             except HTTPException:
@@ -198,7 +499,7 @@ class TaskDaemon:
         async def redrive_task(task_id: int):
             try:
                 if self.queue.redrive_task(task_id):
-                    self.metrics.update_queue_size(self.queue.size())
+                    self._bump_state()
                     return {"message": "Task redriven"}
                 raise HTTPException(
                     status_code=404, detail="Task not found or not failed"
@@ -211,42 +512,201 @@ class TaskDaemon:
     def _worker(self):
         """Worker thread function."""
         self.logger.info("Worker started")
+        use_raw = self._use_raw
+        dispatch = self._dispatch
+        # With batch_size > 1 a worker claims several tasks per queue
+        # round-trip and drains them from a local buffer, amortizing the
+        # dequeue cost across the batch when the backlog is deep.
+        batch_size = self.config.batch_size
+        if use_raw:
+            fetch_batch = getattr(self.queue, "dequeue_batch_raw", None)
+        else:
+            fetch_batch = self.queue.dequeue_batch
+        use_batch = batch_size > 1 and fetch_batch is not None
+        buffer = deque()
         while self._running:
             try:
-                task = self.queue.dequeue()
+                if buffer:
+                    task = buffer.popleft()
+                elif use_batch:
+                    buffer.extend(fetch_batch(batch_size))
+                    task = buffer.popleft() if buffer else None
+                else:
+                    task = self.queue.dequeue_raw() if use_raw else self.queue.dequeue()
                 if task:
                     task_id, task_type, task_data = task
                     start_time = time.time()
 
                     try:
-                        handler = get_task_handler(task_type)
-                        if handler:
-                            result = self._invoke_handler(handler, task_data)
+                        compiled = dispatch.get(task_type)
+                        if compiled is None:
+                            # Handlers registered via the module-level
+                            # decorator compile on first sight.
+                            handler = get_task_handler(task_type)
+                            if handler is not None:
+                                compiled = dispatch[task_type] = self._compile_handler(
+                                    handler, use_raw
+                                )
+                        if compiled is not None:
+                            result = compiled(task_data)
                             self.queue.mark_complete(task_id, result)
-                            self.logger.info(f"Task {task_id} completed: {result}")
+                            self.logger.info("Task %s completed: %s", task_id, result)
                         else:
                             self.logger.warning(
                                 f"No handler for task type: {task_type}"
                             )
                             self.queue.mark_complete(task_id)
                         duration = time.time() - start_time
-                        self.metrics.task_processed("success", duration)
-                        self.logger.info(f"Task {task_id} completed in {duration:.2f}s")
+                        self.metrics.task_processed_local("success", duration)
+                        self.logger.info(
+                            "Task %s completed in %.2fs", task_id, duration
+                        )
 
                     except Exception as e:
-                        self.queue.mark_failed(task_id, str(e), self.config.max_retries)
-                        self.metrics.task_processed("failed")
-                        self.logger.error(f"Task {task_id} failed: {e}")
-
-                    self.metrics.update_queue_size(self.queue.size())
+                        self.queue.mark_failed(
+                            task_id,
+                            str(e),
+                            self.config.max_retries,
+                            backoff=self._retry_delay,
+                        )
+                        self.metrics.task_processed_local("failed")
+                        self.logger.error("Task %s failed: %s", task_id, e)
+
+                    # Queue size gauge is refreshed by the metrics
+                    # reporter thread, not per task.
+                    with self._task_event:
+                        self._state_version += 1
+                        self._task_event.notify_all()
                 else:
+                    # In-memory queues wake this immediately on enqueue;
+                    # the SQLite queue just sleeps out the poll interval.
                     if self.config.worker_sleep > 0.0:
-                        time.sleep(self.config.worker_sleep)
+                        self.queue.wait_for_task(self.config.worker_sleep)
 
             except Exception as e:
-                self.logger.error(f"Worker error: {e}")
+                self.logger.error("Worker error: %s", e)
                 time.sleep(1)
 
+    async def _invoke_handler_async(self, handler, task_data, raw=False):
+        """Async counterpart of _invoke_handler for coroutine handlers."""
+        meta = get_handler_meta(handler)
+
+        if raw and task_data is not None:
+            if meta.call_shape == "model":
+                task_data = meta.validate_input_json(task_data)
+            else:
+                task_data = _loads(task_data)
+
+        if meta.call_shape == "no_args":
+            result = await handler()
+        elif meta.call_shape == "model":
+            if isinstance(task_data, BaseModel):
+                result = await handler(task_data)
+            elif task_data is not None:
+                result = await handler(meta.validate_input(task_data))
+            else:
+                result = await handler(task_data)
+        elif meta.call_shape == "event":
+            result = await handler(task_data)
+        else:
+            if isinstance(task_data, dict):
+                if "args" in task_data and len(task_data) == 1:
+                    result = await handler(*task_data["args"])
+                else:
+                    result = await handler(**task_data)
+            else:
+                result = await handler(task_data)
+
+        if isinstance(result, BaseModel):
+            return (
+                meta.serialize_output(result)
+                if meta.serialize_output is not None
+                else result.model_dump()
+            )
+        return result
+
+    async def _async_worker(self):
+        """Async worker coroutine (worker_mode="async").
+
+        Coroutine handlers run natively on the event loop, which fans
+        out I/O-bound work far beyond what a thread pool allows; sync
+        handlers hop to the default executor so they never block the
+        loop. Queue calls stay synchronous — they are sub-millisecond
+        on SQLite and not worth a per-operation async round-trip.
+        """
+        self.logger.info("Async worker started")
+        loop = asyncio.get_running_loop()
+        use_raw = self._use_raw
+        while self._running:
+            try:
+                task = self.queue.dequeue_raw() if use_raw else self.queue.dequeue()
+                if task:
+                    task_id, task_type, task_data = task
+                    start_time = time.time()
+
+                    try:
+                        handler = get_task_handler(task_type)
+                        if handler is not None:
+                            if get_handler_meta(handler).is_async:
+                                result = await self._invoke_handler_async(
+                                    handler, task_data, raw=use_raw
+                                )
+                            else:
+                                result = await loop.run_in_executor(
+                                    None,
+                                    self._invoke_handler,
+                                    handler,
+                                    task_data,
+                                    use_raw,
+                                )
+                            self.queue.mark_complete(task_id, result)
+                        else:
+                            self.logger.warning(
+                                f"No handler for task type: {task_type}"
+                            )
+                            self.queue.mark_complete(task_id)
+                        duration = time.time() - start_time
+                        self.metrics.task_processed_local("success", duration)
+                        self.logger.info(
+                            "Task %s completed in %.2fs", task_id, duration
+                        )
+
+                    except Exception as e:
+                        self.queue.mark_failed(
+                            task_id,
+                            str(e),
+                            self.config.max_retries,
+                            backoff=self._retry_delay,
+                        )
+                        self.metrics.task_processed_local("failed")
+                        self.logger.error("Task %s failed: %s", task_id, e)
+
+                    with self._task_event:
+                        self._state_version += 1
+                        self._task_event.notify_all()
+                else:
+                    await asyncio.sleep(self.config.worker_sleep or 0.05)
+
+            except Exception as e:
+                self.logger.error("Worker error: %s", e)
+                await asyncio.sleep(1)
+
+    def _maintenance_loop(self):
+        """Periodically purge old terminal tasks and compact the queue."""
+        next_run = time.time() + self.config.maintenance_interval
+        while self._running:
+            time.sleep(0.5)
+            if time.time() < next_run:
+                continue
+            next_run = time.time() + self.config.maintenance_interval
+            try:
+                purged = self.queue.purge_terminal(self.config.retention_seconds)
+                if purged:
+                    self.logger.info("Moved %d tasks to dead-letter table", purged)
+                self.queue.maintain()
+            except Exception as e:
+                self.logger.error("Maintenance error: %s", e)
+
     def start_workers(self):
         """Start worker threads."""
         self._running = True
@@ -254,23 +714,49 @@ class TaskDaemon:
             worker = threading.Thread(target=self._worker, daemon=True)
             worker.start()
             self._workers.append(worker)
-        self.logger.info(f"Started {self.config.worker_threads} workers")
+        if hasattr(self.queue, "purge_terminal"):
+            threading.Thread(target=self._maintenance_loop, daemon=True).start()
+        self.metrics.start_reporter(self.queue)
+        self.logger.info("Started %d workers", self.config.worker_threads)
 
     def stop_workers(self):
         """Stop worker threads."""
         self._running = False
+        self.metrics.stop_reporter()
         self.logger.info("Stopping workers")
 
     def register_handler(self, handler_func):
         """Register a task handler using function name as task type."""
         register_handler(handler_func)
         task_type = handler_func.__name__
-        self.logger.info(f"Registered handler: {task_type}")
+        self._dispatch[task_type] = self._compile_handler(handler_func, self._use_raw)
+        self.logger.info("Registered handler: %s", task_type)
         return self
 
+    def _start_async_mode(self):
+        """Schedule async workers to start with uvicorn's event loop.
+
+        Only task execution moves onto the loop; the maintenance loop
+        and metrics reporter stay on their support threads.
+        """
+        self._running = True
+        if hasattr(self.queue, "purge_terminal"):
+            threading.Thread(target=self._maintenance_loop, daemon=True).start()
+        self.metrics.start_reporter(self.queue)
+
+        @self.app.on_event("startup")
+        async def start_async_workers():
+            for _ in range(self.config.worker_threads):
+                asyncio.create_task(self._async_worker())
+
+        self.logger.info("Scheduled %d async workers", self.config.worker_threads)
+
     def run(self, **kwargs):
         """Run the daemon server (HTTP only)."""
-        self.start_workers()
+        if self.config.worker_mode == "async":
+            self._start_async_mode()
+        else:
+            self.start_workers()
         self.metrics.set_health(True)
 
         uvicorn_kwargs = {
@@ -280,14 +766,29 @@ class TaskDaemon:
             **kwargs,
         }
 
+        # Prefer uvloop for the HTTP event loop when it is installed;
+        # it handles far more concurrent connections per core than the
+        # stdlib loop. CPU-bound task handlers stay on worker threads.
+        if "loop" not in uvicorn_kwargs:
+            try:
+                import uvloop  # noqa: F401
+
+                uvicorn_kwargs["loop"] = "uvloop"
+            except ImportError:
+                pass
+
         try:
             uvicorn.run(self.app, **uvicorn_kwargs)
         finally:
             self.stop_workers()
             self.metrics.set_health(False)
 
-    def run_with_grpc(self, grpc_port: int = 50051, grpc_protocol: str = "json"):
-        """Run the daemon with gRPC server only."""
+    def run_with_grpc(self, grpc_port=50051, grpc_protocol: str = "json"):
+        """Run the daemon with gRPC server only.
+
+        ``grpc_port`` may also be a full address string such as
+        ``unix:/tmp/daemon.sock`` to serve over a Unix domain socket.
+        """
         from ..grpc_service import serve_grpc
 
         self.start_workers()
@@ -295,7 +796,7 @@ class TaskDaemon:
 
         grpc_server = serve_grpc(self, port=grpc_port, protocol=grpc_protocol)
         self.logger.info(
-            f"gRPC server started on port {grpc_port} with {grpc_protocol} protocol"
+            "gRPC server started on %s with %s protocol", grpc_port, grpc_protocol
         )
 
         try:
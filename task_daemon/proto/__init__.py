@@ -1,4 +1,20 @@
 """gRPC protocol buffers for TaskDaemon."""
 
+import logging
+import os
+
+# Select the C-backed upb protobuf runtime before any pb2 import; the
+# pure-Python backend is orders of magnitude slower to encode/decode.
+os.environ.setdefault("PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION", "upb")
+
 from .task_daemon_pb2 import *
 from .task_daemon_pb2_grpc import *
+
+from google.protobuf.internal import api_implementation
+
+if api_implementation.Type() not in ("cpp", "upb"):  # pragma: no cover
+    logging.getLogger(__name__).warning(
+        "protobuf is using the pure-Python backend (%s); "
+        "gRPC serialization will be slow",
+        api_implementation.Type(),
+    )
@@ -2,53 +2,61 @@
 # Generated by the protocol buffer compiler.  DO NOT EDIT!
 # NO CHECKED-IN PROTOBUF GENCODE
 # source: task_daemon.proto
-# Protobuf Python Version: 5.29.0
+# Protobuf Python Version: 6.31.1
 """Generated protocol buffer code."""
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import descriptor_pool as _descriptor_pool
 from google.protobuf import runtime_version as _runtime_version
 from google.protobuf import symbol_database as _symbol_database
 from google.protobuf.internal import builder as _builder
-
 _runtime_version.ValidateProtobufRuntimeVersion(
-    _runtime_version.Domain.PUBLIC, 5, 29, 0, "", "task_daemon.proto"
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'task_daemon.proto'
 )
 # @@protoc_insertion_point(imports)
 
 _sym_db = _symbol_database.Default()
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(
-    b'\n\x11task_daemon.proto\x12\ntaskdaemon"\x07\n\x05\x45mpty"8\n\x0bTaskRequest\x12\x11\n\ttask_type\x18\x01 \x01(\t\x12\x16\n\x0etask_data_json\x18\x02 \x01(\t"\x1f\n\x0cTaskResponse\x12\x0f\n\x07task_id\x18\x01 \x01(\x05" \n\rTaskIdRequest\x12\x0f\n\x07task_id\x18\x01 \x01(\x05"\xac\x01\n\x08TaskInfo\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x11\n\ttask_type\x18\x02 \x01(\t\x12\x11\n\ttask_data\x18\x03 \x01(\t\x12\x0e\n\x06status\x18\x04 \x01(\t\x12\x12\n\ncreated_at\x18\x05 \x01(\t\x12\x14\n\x0c\x63ompleted_at\x18\x06 \x01(\t\x12\x10\n\x08\x61ttempts\x18\x07 \x01(\x05\x12\x12\n\nlast_error\x18\x08 \x01(\t\x12\x0e\n\x06result\x18\t \x01(\t"V\n\x0cHealthStatus\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x12\n\nqueue_size\x18\x02 \x01(\x05\x12\x11\n\ttimestamp\x18\x03 \x01(\t\x12\x0f\n\x07workers\x18\x04 \x01(\x05"\x95\x01\n\x0eMetricsSummary\x12\x16\n\x0etasks_received\x18\x01 \x01(\x01\x12\x1f\n\x17tasks_processed_success\x18\x02 \x01(\x01\x12\x1e\n\x16tasks_processed_failed\x18\x03 \x01(\x01\x12\x12\n\nqueue_size\x18\x04 \x01(\x01\x12\x16\n\x0e\x64\x61\x65mon_healthy\x18\x05 \x01(\x08"!\n\x10ListTasksRequest\x12\r\n\x05limit\x18\x01 \x01(\x05"/\n\x08TaskList\x12#\n\x05tasks\x18\x01 \x03(\x0b\x32\x14.taskdaemon.TaskInfo"2\n\x0e\x44\x65leteResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t"3\n\x0fRedriveResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t2\xcc\x03\n\nTaskDaemon\x12>\n\tQueueTask\x12\x17.taskdaemon.TaskRequest\x1a\x18.taskdaemon.TaskResponse\x12:\n\x07GetTask\x12\x19.taskdaemon.TaskIdRequest\x1a\x14.taskdaemon.TaskInfo\x12\x38\n\tGetHealth\x12\x11.taskdaemon.Empty\x1a\x18.taskdaemon.HealthStatus\x12;\n\nGetMetrics\x12\x11.taskdaemon.Empty\x1a\x1a.taskdaemon.MetricsSummary\x12?\n\tListTasks\x12\x1c.taskdaemon.ListTasksRequest\x1a\x14.taskdaemon.TaskList\x12\x43\n\nDeleteTask\x12\x19.taskdaemon.TaskIdRequest\x1a\x1a.taskdaemon.DeleteResponse\x12\x45\n\x0bRedriveTask\x12\x19.taskdaemon.TaskIdRequest\x1a\x1b.taskdaemon.RedriveResponseb\x06proto3'
-)
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x11task_daemon.proto\x12\ntaskdaemon\"\x07\n\x05\x45mpty\"3\n\x0bTaskRequest\x12\x11\n\ttask_type\x18\x01 \x01(\t\x12\x11\n\ttask_data\x18\x02 \x01(\x0c\"\x1f\n\x0cTaskResponse\x12\x0f\n\x07task_id\x18\x01 \x01(\x05\"\x1f\n\x0bTaskIdBatch\x12\x10\n\x08task_ids\x18\x01 \x03(\x05\" \n\rTaskIdRequest\x12\x0f\n\x07task_id\x18\x01 \x01(\x05\"\x1e\n\nTaskIdList\x12\x10\n\x08task_ids\x18\x01 \x03(\x05\"\xac\x01\n\x08TaskInfo\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x11\n\ttask_type\x18\x02 \x01(\t\x12\x11\n\ttask_data\x18\x03 \x01(\x0c\x12\x0e\n\x06status\x18\x04 \x01(\t\x12\x12\n\ncreated_at\x18\x05 \x01(\t\x12\x14\n\x0c\x63ompleted_at\x18\x06 \x01(\t\x12\x10\n\x08\x61ttempts\x18\x07 \x01(\x05\x12\x12\n\nlast_error\x18\x08 \x01(\t\x12\x0e\n\x06result\x18\t \x01(\x0c\"V\n\x0cHealthStatus\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x12\n\nqueue_size\x18\x02 \x01(\x05\x12\x11\n\ttimestamp\x18\x03 \x01(\t\x12\x0f\n\x07workers\x18\x04 \x01(\x05\"\x95\x01\n\x0eMetricsSummary\x12\x16\n\x0etasks_received\x18\x01 \x01(\x01\x12\x1f\n\x17tasks_processed_success\x18\x02 \x01(\x01\x12\x1e\n\x16tasks_processed_failed\x18\x03 \x01(\x01\x12\x12\n\nqueue_size\x18\x04 \x01(\x01\x12\x16\n\x0e\x64\x61\x65mon_healthy\x18\x05 \x01(\x08\"!\n\x10ListTasksRequest\x12\r\n\x05limit\x18\x01 \x01(\x05\"/\n\x08TaskList\x12#\n\x05tasks\x18\x01 \x03(\x0b\x32\x14.taskdaemon.TaskInfo\"2\n\x0e\x44\x65leteResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\"3\n\x0fRedriveResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t2\xce\x04\n\nTaskDaemon\x12>\n\tQueueTask\x12\x17.taskdaemon.TaskRequest\x1a\x18.taskdaemon.TaskResponse\x12\x44\n\x0eQueueTaskBatch\x12\x17.taskdaemon.TaskRequest\x1a\x17.taskdaemon.TaskIdBatch(\x01\x12:\n\x07GetTask\x12\x19.taskdaemon.TaskIdRequest\x1a\x14.taskdaemon.TaskInfo\x12\x38\n\x08GetTasks\x12\x16.taskdaemon.TaskIdList\x1a\x14.taskdaemon.TaskList\x12\x38\n\tGetHealth\x12\x11.taskdaemon.Empty\x1a\x18.taskdaemon.HealthStatus\x12;\n\nGetMetrics\x12\x11.taskdaemon.Empty\x1a\x1a.taskdaemon.MetricsSummary\x12\x41\n\tListTasks\x12\x1c.taskdaemon.ListTasksRequest\x1a\x14.taskdaemon.TaskInfo0\x01\x12\x43\n\nDeleteTask\x12\x19.taskdaemon.TaskIdRequest\x1a\x1a.taskdaemon.DeleteResponse\x12\x45\n\x0bRedriveTask\x12\x19.taskdaemon.TaskIdRequest\x1a\x1b.taskdaemon.RedriveResponseb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
-_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, "task_daemon_pb2", _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'task_daemon_pb2', _globals)
 if not _descriptor._USE_C_DESCRIPTORS:
-    DESCRIPTOR._loaded_options = None
-    _globals["_EMPTY"]._serialized_start = 33
-    _globals["_EMPTY"]._serialized_end = 40
-    _globals["_TASKREQUEST"]._serialized_start = 42
-    _globals["_TASKREQUEST"]._serialized_end = 98
-    _globals["_TASKRESPONSE"]._serialized_start = 100
-    _globals["_TASKRESPONSE"]._serialized_end = 131
-    _globals["_TASKIDREQUEST"]._serialized_start = 133
-    _globals["_TASKIDREQUEST"]._serialized_end = 165
-    _globals["_TASKINFO"]._serialized_start = 168
-    _globals["_TASKINFO"]._serialized_end = 340
-    _globals["_HEALTHSTATUS"]._serialized_start = 342
-    _globals["_HEALTHSTATUS"]._serialized_end = 428
-    _globals["_METRICSSUMMARY"]._serialized_start = 431
-    _globals["_METRICSSUMMARY"]._serialized_end = 580
-    _globals["_LISTTASKSREQUEST"]._serialized_start = 582
-    _globals["_LISTTASKSREQUEST"]._serialized_end = 615
-    _globals["_TASKLIST"]._serialized_start = 617
-    _globals["_TASKLIST"]._serialized_end = 664
-    _globals["_DELETERESPONSE"]._serialized_start = 666
-    _globals["_DELETERESPONSE"]._serialized_end = 716
-    _globals["_REDRIVERESPONSE"]._serialized_start = 718
-    _globals["_REDRIVERESPONSE"]._serialized_end = 769
-    _globals["_TASKDAEMON"]._serialized_start = 772
-    _globals["_TASKDAEMON"]._serialized_end = 1232
+  DESCRIPTOR._loaded_options = None
+  _globals['_EMPTY']._serialized_start=33
+  _globals['_EMPTY']._serialized_end=40
+  _globals['_TASKREQUEST']._serialized_start=42
+  _globals['_TASKREQUEST']._serialized_end=93
+  _globals['_TASKRESPONSE']._serialized_start=95
+  _globals['_TASKRESPONSE']._serialized_end=126
+  _globals['_TASKIDBATCH']._serialized_start=128
+  _globals['_TASKIDBATCH']._serialized_end=159
+  _globals['_TASKIDREQUEST']._serialized_start=161
+  _globals['_TASKIDREQUEST']._serialized_end=193
+  _globals['_TASKIDLIST']._serialized_start=195
+  _globals['_TASKIDLIST']._serialized_end=225
+  _globals['_TASKINFO']._serialized_start=228
+  _globals['_TASKINFO']._serialized_end=400
+  _globals['_HEALTHSTATUS']._serialized_start=402
+  _globals['_HEALTHSTATUS']._serialized_end=488
+  _globals['_METRICSSUMMARY']._serialized_start=491
+  _globals['_METRICSSUMMARY']._serialized_end=640
+  _globals['_LISTTASKSREQUEST']._serialized_start=642
+  _globals['_LISTTASKSREQUEST']._serialized_end=675
+  _globals['_TASKLIST']._serialized_start=677
+  _globals['_TASKLIST']._serialized_end=724
+  _globals['_DELETERESPONSE']._serialized_start=726
+  _globals['_DELETERESPONSE']._serialized_end=776
+  _globals['_REDRIVERESPONSE']._serialized_start=778
+  _globals['_REDRIVERESPONSE']._serialized_end=829
+  _globals['_TASKDAEMON']._serialized_start=832
+  _globals['_TASKDAEMON']._serialized_end=1422
 # @@protoc_insertion_point(module_scope)
@@ -0,0 +1,119 @@
+from google.protobuf.internal import containers as _containers
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class Empty(_message.Message):
+    __slots__ = ()
+    def __init__(self) -> None: ...
+
+class TaskRequest(_message.Message):
+    __slots__ = ("task_type", "task_data")
+    TASK_TYPE_FIELD_NUMBER: _ClassVar[int]
+    TASK_DATA_FIELD_NUMBER: _ClassVar[int]
+    task_type: str
+    task_data: bytes
+    def __init__(self, task_type: _Optional[str] = ..., task_data: _Optional[bytes] = ...) -> None: ...
+
+class TaskResponse(_message.Message):
+    __slots__ = ("task_id",)
+    TASK_ID_FIELD_NUMBER: _ClassVar[int]
+    task_id: int
+    def __init__(self, task_id: _Optional[int] = ...) -> None: ...
+
+class TaskIdBatch(_message.Message):
+    __slots__ = ("task_ids",)
+    TASK_IDS_FIELD_NUMBER: _ClassVar[int]
+    task_ids: _containers.RepeatedScalarFieldContainer[int]
+    def __init__(self, task_ids: _Optional[_Iterable[int]] = ...) -> None: ...
+
+class TaskIdRequest(_message.Message):
+    __slots__ = ("task_id",)
+    TASK_ID_FIELD_NUMBER: _ClassVar[int]
+    task_id: int
+    def __init__(self, task_id: _Optional[int] = ...) -> None: ...
+
+class TaskIdList(_message.Message):
+    __slots__ = ("task_ids",)
+    TASK_IDS_FIELD_NUMBER: _ClassVar[int]
+    task_ids: _containers.RepeatedScalarFieldContainer[int]
+    def __init__(self, task_ids: _Optional[_Iterable[int]] = ...) -> None: ...
+
+class TaskInfo(_message.Message):
+    __slots__ = ("id", "task_type", "task_data", "status", "created_at", "completed_at", "attempts", "last_error", "result")
+    ID_FIELD_NUMBER: _ClassVar[int]
+    TASK_TYPE_FIELD_NUMBER: _ClassVar[int]
+    TASK_DATA_FIELD_NUMBER: _ClassVar[int]
+    STATUS_FIELD_NUMBER: _ClassVar[int]
+    CREATED_AT_FIELD_NUMBER: _ClassVar[int]
+    COMPLETED_AT_FIELD_NUMBER: _ClassVar[int]
+    ATTEMPTS_FIELD_NUMBER: _ClassVar[int]
+    LAST_ERROR_FIELD_NUMBER: _ClassVar[int]
+    RESULT_FIELD_NUMBER: _ClassVar[int]
+    id: int
+    task_type: str
+    task_data: bytes
+    status: str
+    created_at: str
+    completed_at: str
+    attempts: int
+    last_error: str
+    result: bytes
+    def __init__(self, id: _Optional[int] = ..., task_type: _Optional[str] = ..., task_data: _Optional[bytes] = ..., status: _Optional[str] = ..., created_at: _Optional[str] = ..., completed_at: _Optional[str] = ..., attempts: _Optional[int] = ..., last_error: _Optional[str] = ..., result: _Optional[bytes] = ...) -> None: ...
+
+class HealthStatus(_message.Message):
+    __slots__ = ("status", "queue_size", "timestamp", "workers")
+    STATUS_FIELD_NUMBER: _ClassVar[int]
+    QUEUE_SIZE_FIELD_NUMBER: _ClassVar[int]
+    TIMESTAMP_FIELD_NUMBER: _ClassVar[int]
+    WORKERS_FIELD_NUMBER: _ClassVar[int]
+    status: str
+    queue_size: int
+    timestamp: str
+    workers: int
+    def __init__(self, status: _Optional[str] = ..., queue_size: _Optional[int] = ..., timestamp: _Optional[str] = ..., workers: _Optional[int] = ...) -> None: ...
+
+class MetricsSummary(_message.Message):
+    __slots__ = ("tasks_received", "tasks_processed_success", "tasks_processed_failed", "queue_size", "daemon_healthy")
+    TASKS_RECEIVED_FIELD_NUMBER: _ClassVar[int]
+    TASKS_PROCESSED_SUCCESS_FIELD_NUMBER: _ClassVar[int]
+    TASKS_PROCESSED_FAILED_FIELD_NUMBER: _ClassVar[int]
+    QUEUE_SIZE_FIELD_NUMBER: _ClassVar[int]
+    DAEMON_HEALTHY_FIELD_NUMBER: _ClassVar[int]
+    tasks_received: float
+    tasks_processed_success: float
+    tasks_processed_failed: float
+    queue_size: float
+    daemon_healthy: bool
+    def __init__(self, tasks_received: _Optional[float] = ..., tasks_processed_success: _Optional[float] = ..., tasks_processed_failed: _Optional[float] = ..., queue_size: _Optional[float] = ..., daemon_healthy: bool = ...) -> None: ...
+
+class ListTasksRequest(_message.Message):
+    __slots__ = ("limit",)
+    LIMIT_FIELD_NUMBER: _ClassVar[int]
+    limit: int
+    def __init__(self, limit: _Optional[int] = ...) -> None: ...
+
+class TaskList(_message.Message):
+    __slots__ = ("tasks",)
+    TASKS_FIELD_NUMBER: _ClassVar[int]
+    tasks: _containers.RepeatedCompositeFieldContainer[TaskInfo]
+    def __init__(self, tasks: _Optional[_Iterable[_Union[TaskInfo, _Mapping]]] = ...) -> None: ...
+
+class DeleteResponse(_message.Message):
+    __slots__ = ("success", "message")
+    SUCCESS_FIELD_NUMBER: _ClassVar[int]
+    MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    success: bool
+    message: str
+    def __init__(self, success: bool = ..., message: _Optional[str] = ...) -> None: ...
+
+class RedriveResponse(_message.Message):
+    __slots__ = ("success", "message")
+    SUCCESS_FIELD_NUMBER: _ClassVar[int]
+    MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    success: bool
+    message: str
+    def __init__(self, success: bool = ..., message: _Optional[str] = ...) -> None: ...
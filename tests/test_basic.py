@@ -116,55 +116,64 @@ def test_queue_new_features(daemon):
     assert task_details["last_error"] is None
 
 
-@patch("requests.get")
-@patch("requests.post")
-@patch("requests.delete")
-def test_client_new_methods(mock_delete, mock_post, mock_get):
+def test_client_new_methods():
     """Test new client methods."""
     client = DaemonClient("http://localhost:8080")
+    # Requests go through the urllib3 pool, so mock its request method
+    mock_request = client._http.request = Mock()
 
     # Test get_task
-    mock_get.return_value.status_code = 200
-    mock_get.return_value.json.return_value = {
-        "id": 1,
-        "status": "completed",
-        "task_type": "test",
-        "task_data": "{}",
-        "created_at": "2023-01-01",
-        "attempts": 0,
-    }
+    import json
+
+    mock_request.return_value.status = 200
+    mock_request.return_value.data = json.dumps(
+        {
+            "id": 1,
+            "status": "completed",
+            "task_type": "test",
+            "task_data": "{}",
+            "created_at": "2023-01-01",
+            "attempts": 0,
+        }
+    ).encode()
 
     task = client.get_task(1)
     assert task.id == 1  # Pydantic model attribute access
     assert task.status == "completed"
-    mock_get.assert_called_with("http://localhost:8080/api/tasks/1", timeout=0.1)
+    mock_request.assert_called_with(
+        "GET", "http://localhost:8080/api/tasks/1", timeout=client._timeout
+    )
 
     # Test get_task not found
-    mock_get.return_value.status_code = 404
+    mock_request.return_value.status = 404
     task = client.get_task(999)
     assert task is None
 
     # Test delete_task
-    mock_delete.return_value.status_code = 200
+    mock_request.return_value.status = 200
     result = client.delete_task(1)
     assert result is True
-    mock_delete.assert_called_with("http://localhost:8080/api/tasks/1", timeout=0.1)
+    mock_request.assert_called_with(
+        "DELETE", "http://localhost:8080/api/tasks/1", timeout=client._timeout
+    )
 
     # Test delete_task failure
-    mock_delete.return_value.status_code = 404
+    mock_request.return_value.status = 404
     result = client.delete_task(999)
     assert result is False
 
     # Test redrive_task
-    mock_post.return_value.status_code = 200
+    mock_request.return_value.status = 200
     result = client.redrive_task(1)
     assert result is True
-    mock_post.assert_called_with(
-        "http://localhost:8080/api/tasks/1/redrive", timeout=0.1
+    mock_request.assert_called_with(
+        "POST",
+        "http://localhost:8080/api/tasks/1/redrive",
+        timeout=client._timeout,
     )
 
     # Test redrive_task failure
-    mock_post.return_value.status_code = 404
+    mock_request.return_value.status = 404
     result = client.redrive_task(999)
     assert result is False
 
@@ -231,6 +240,43 @@ def test_memory_queue_implementation():
     assert task_details["result"]["result"] == "success"
 
 
+def test_memory_queue_backoff_does_not_wake_waiters():
+    """A backed-off retry must not count as ready work.
+
+    Regression test: wait_for_task used to return True for a task still
+    inside its retry-backoff window while dequeue kept returning None,
+    so the worker loop spun at 100% CPU for the whole window.
+    """
+    from task_daemon.core import MemoryQueue
+
+    queue = MemoryQueue()
+    task_id = queue.enqueue("test_type", {"data": "test"})
+    claimed = queue.dequeue()
+    assert claimed is not None and claimed[0] == task_id
+
+    queue.mark_failed(task_id, "boom", max_retries=3, backoff=lambda attempts: 0.3)
+
+    # During the backoff window the waiter times out instead of
+    # reporting work that dequeue can't deliver.
+    start = time.monotonic()
+    assert queue.wait_for_task(0.05) is False
+    assert time.monotonic() - start >= 0.04
+    assert queue.dequeue() is None
+
+    # A long wait is capped at the retry's maturity, not slept out.
+    start = time.monotonic()
+    queue.wait_for_task(5.0)
+    assert time.monotonic() - start < 1.0
+
+    # Once matured the task is claimable again.
+    deadline = time.monotonic() + 2.0
+    claimed = None
+    while claimed is None and time.monotonic() < deadline:
+        queue.wait_for_task(0.05)
+        claimed = queue.dequeue()
+    assert claimed is not None and claimed[0] == task_id
+
+
 def test_pydantic_output_serialization():
     """Test that Pydantic model outputs are properly serialized."""
     from prometheus_client import CollectorRegistry